@@ -1,9 +1,11 @@
 import asyncio
 import logging
-from collections.abc import Iterable, Mapping, Sequence
-from datetime import UTC, datetime
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from email.utils import formatdate
-from typing import NamedTuple
+from functools import cache, partial
+from time import monotonic, time
+from types import MappingProxyType
+from typing import NamedTuple, Self
 
 import aiohttp
 from aiohttp import ClientSession
@@ -44,55 +46,220 @@ from .registry import (
 
 # Map from the relay-mode-specific control sensor ID (as advertised in the
 # `relay?` response) to the registry fragment that models it.
-_RELAY_FRAGMENTS_BY_SENSOR_ID: Mapping[str, type[OumanRegistry]] = {
-    RelayPumpSummerStop.CONTROL.sensor_endpoint_id: RelayPumpSummerStop,
-    RelayTemperature.CONTROL.sensor_endpoint_id: RelayTemperature,
-    RelayTempDifference.CONTROL.sensor_endpoint_id: RelayTempDifference,
-    RelayL1ValvePosition.CONTROL.sensor_endpoint_id: RelayL1ValvePosition,
-    RelayTimeProgram.CONTROL.sensor_endpoint_id: RelayTimeProgram,
-}
+_RELAY_FRAGMENTS_BY_SENSOR_ID: Mapping[str, type[OumanRegistry]] = MappingProxyType(
+    {
+        RelayPumpSummerStop.CONTROL.sensor_endpoint_id: RelayPumpSummerStop,
+        RelayTemperature.CONTROL.sensor_endpoint_id: RelayTemperature,
+        RelayTempDifference.CONTROL.sensor_endpoint_id: RelayTempDifference,
+        RelayL1ValvePosition.CONTROL.sensor_endpoint_id: RelayL1ValvePosition,
+        RelayTimeProgram.CONTROL.sensor_endpoint_id: RelayTimeProgram,
+    }
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Read-only requests whose parsed responses may be served from the cache.
+_CACHEABLE_REQUESTS = frozenset({"request", "alarms"})
+
+# Last formatted GMT string param, keyed by the whole second it was built for.
+_gmt_string_param_cache: tuple[int, str] = (0, "")
+
+
+def _gmt_string_param() -> str:
+    global _gmt_string_param_cache
+    now = int(time())
+    cached_ts, cached_param = _gmt_string_param_cache
+    if now != cached_ts:
+        cached_param = formatdate(timeval=now, localtime=False, usegmt=True) + "="
+        _gmt_string_param_cache = (now, cached_param)
+    return cached_param
+
+
+def _check_bounds(
+    endpoint: IntControlOumanEndpoint | FloatControlOumanEndpoint, value: float
+) -> None:
+    min_val, max_val = endpoint.min_val, endpoint.max_val
+    if not (min_val <= value <= max_val):
+        raise ValueError(
+            f"Value for {endpoint.name} out of bounds [{min_val},{max_val}]: {value}"
+        )
+
 
 class _OumanResponse(NamedTuple):
     prefix: str
     values: Mapping[str, str]
 
 
+_ResultCheck = Callable[[_OumanResponse], OumanValues]
+
+_L1_ROOM_SENSOR_INSTALLED_ID = L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
+_L2_INSTALLED_ID = SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id
+_L2_ROOM_SENSOR_INSTALLED_ID = L2BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
+
+# Sensor IDs read in a single request to detect the device configuration.
+_REGISTRY_PROBE_SENSOR_IDS = (
+    _L1_ROOM_SENSOR_INSTALLED_ID,
+    _L2_INSTALLED_ID,
+    _L2_ROOM_SENSOR_INSTALLED_ID,
+)
+
+
+@cache
+def _registry_set(registries: tuple[type[OumanRegistry], ...]) -> OumanRegistrySet:
+    # Only a handful of registry combinations exist, so share one set (and
+    # its lookup tables) per combination instead of rebuilding it.
+    return OumanRegistrySet(registries)
+
+
+def _require_value(response: _OumanResponse, endpoint_id: str) -> str:
+    value = response.values.get(endpoint_id)
+    if value is None:
+        raise ValueError("Response value should be defined")
+    return value
+
+
+def _is_l2_installed_value(value: str) -> bool:
+    # Observed values: '0' (L2 disabled), '1' (L2 enabled in software).
+    return value == "1"
+
+
+def _is_room_sensor_installed_value(value: str) -> bool:
+    # The device may return composite values like "on,error" (sensor
+    # configured but reporting fault) or "off,error" (channel disabled
+    # with error flag retained). Only the prefix indicates whether a
+    # sensor is configured.
+    return value.split(",")[0] == "on"
+
+
 class OumanEh800Client:
     """Client for communicating with an Ouman EH-800 heating controller.
 
+    The same session should be reused for all requests to the device so that
+    the underlying connection is kept alive between calls. Use `create()` to
+    get a client with a session tuned for a single local device.
+
     Args:
         session: An aiohttp ClientSession for making HTTP requests.
         address: The base URL of the device (e.g., "http://192.168.1.100").
         username: Username for authentication.
         password: Password for authentication.
+        request_timeout: Total timeout in seconds for a single request.
+        cache_ttl: Seconds to reuse the response of an identical value or
+            alarm query. Updates clear the cache. Disabled when 0.
+        registry_cache_ttl: Seconds to reuse the result of
+            `get_active_registries()`. Disabled when 0.
     """
 
+    __slots__ = (
+        "_session",
+        "_address",
+        "_username",
+        "_password",
+        "_timeout",
+        "_owns_session",
+        "_cache_ttl",
+        "_cache",
+        "_cache_generation",
+        "_registry_cache_ttl",
+        "_registry_cache",
+        "_login_lock",
+        "_login_epoch",
+    )
+
     def __init__(
-        self, session: ClientSession, address: str, username: str, password: str
+        self,
+        session: ClientSession,
+        address: str,
+        username: str,
+        password: str,
+        request_timeout: float = 10,
+        cache_ttl: float = 0,
+        registry_cache_ttl: float = 0,
     ):
         self._session: ClientSession = session
         self._address: str = address
         self._username: str = username
         self._password: str = password
+        self._timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(
+            total=request_timeout, sock_connect=5
+        )
+        self._owns_session: bool = False
+        self._cache_ttl: float = cache_ttl
+        self._cache: dict[tuple[str, str], tuple[float, _OumanResponse]] = {}
+        self._cache_generation: int = 0
+        self._registry_cache_ttl: float = registry_cache_ttl
+        self._registry_cache: tuple[float, OumanRegistrySet] | None = None
+        self._login_lock: asyncio.Lock = asyncio.Lock()
+        self._login_epoch: int = 0
+
+    @classmethod
+    async def create(
+        cls,
+        address: str,
+        username: str,
+        password: str,
+        request_timeout: float = 10,
+        cache_ttl: float = 0,
+        registry_cache_ttl: float = 0,
+        limit_per_host: int = 4,
+        keepalive_timeout: float = 75,
+    ) -> Self:
+        """Create a client with its own keep-alive session.
+
+        The session is closed by `close()`.
+
+        Args:
+            address: The base URL of the device (e.g., "http://192.168.1.100").
+            username: Username for authentication.
+            password: Password for authentication.
+            request_timeout: Total timeout in seconds for a single request.
+            cache_ttl: Seconds to reuse the response of an identical value or
+                alarm query. Updates clear the cache. Disabled when 0.
+            registry_cache_ttl: Seconds to reuse the result of
+                `get_active_registries()`. Disabled when 0.
+            limit_per_host: Maximum number of simultaneous connections to the
+                device.
+            keepalive_timeout: Seconds an idle connection is kept open for
+                reuse.
+        """
+        connector = aiohttp.TCPConnector(
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=300,
+        )
+        session = ClientSession(connector=connector)
+        client = cls(
+            session,
+            address,
+            username,
+            password,
+            request_timeout,
+            cache_ttl,
+            registry_cache_ttl,
+        )
+        client._owns_session = True
+        return client
+
+    async def close(self) -> None:
+        """Close the session if it was created by `create()`.
+
+        Sessions passed in by the caller are left open.
+        """
+        if self._owns_session:
+            await self._session.close()
 
     @staticmethod
     def _parse_api_response(response_text: str) -> _OumanResponse:
         prefix, key_val_str = response_text.split("?", maxsplit=1)
-        pairs = [p for p in key_val_str.split(";") if p.strip()]
-
-        # Handle null byte at the end of the response
-        if pairs and pairs[-1] == "\x00":
-            _ = pairs.pop()
+        # Responses end with ";\x00", strip it before splitting the pairs.
+        key_val_str = key_val_str.rstrip(";\x00")
 
         values_result = {}
-        for pair in pairs:
-            if "=" in pair:
-                key, value = pair.split("=", 1)
+        for pair in key_val_str.split(";"):
+            key, sep, value = pair.partition("=")
+            if sep:
                 values_result[key.strip()] = value.strip()
-            else:
+            elif pair.strip():
                 _LOGGER.warning(
                     "Skipping malformed key value pair in Ouman response: '%s'", pair
                 )
@@ -105,33 +272,28 @@ class OumanEh800Client:
     def _construct_request_path(self, name: str, params: Iterable[str]) -> str:
         # Append gmt string and equals symbol to match what the web UI does.
         # The requests work without this param as well, except when there are
-        # no other params.
-        gmt_string_param = (
-            formatdate(
-                timeval=datetime.now(UTC).timestamp(),
-                localtime=False,
-                usegmt=True,
-            )
-            + "="
-        )
-        params = list(params)
-        params.append(gmt_string_param)
-        return f"{name}?" + ";".join(params)
+        # no other params. The string only has second resolution, so it is
+        # shared by all requests made within the same second.
+        return f"{name}?{';'.join([*params, _gmt_string_param()])}"
 
     async def _get(self, path: str) -> str:
         request_url = f"{self._address}/{path}"
         try:
-            async with asyncio.timeout(10):
-                async with self._session.get(request_url) as response:
-                    response.raise_for_status()
+            async with self._session.get(
+                request_url, timeout=self._timeout
+            ) as response:
+                response.raise_for_status()
 
-                    response_text = await response.text()
+                response_text = await response.text()
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug("Raw response from device: '%s'", response_text)
-                    return response_text
+                return response_text
         except TimeoutError as err:
             raise OumanClientCommunicationError("Timeout connecting to device") from err
         except aiohttp.ClientResponseError as err:
-            raise OumanClientCommunicationError(f"HTTP Error: {err.status}") from err
+            raise OumanClientCommunicationError(
+                f"HTTP Error: {err.status}", status=err.status
+            ) from err
         except aiohttp.ClientError as err:
             raise OumanClientCommunicationError(f"Network error: {err}") from err
 
@@ -139,9 +301,40 @@ class OumanEh800Client:
         path = self._construct_request_path(name, params)
         return await self._get(path)
 
+    def _clear_cache(self) -> None:
+        self._cache.clear()
+        self._cache_generation += 1
+
     async def _fetch_parsed(self, name: str, params: Iterable[str]) -> _OumanResponse:
+        if self._cache_ttl <= 0 or name not in _CACHEABLE_REQUESTS:
+            response_text = await self._fetch_raw(name, params)
+            return self._parse_api_response(response_text)
+
+        params = tuple(params)
+        # Key on the joined params so the same IDs passed separately or
+        # pre-joined share one entry.
+        cache_key = (name, ";".join(params))
+        now = monotonic()
+        if (cached := self._cache.get(cache_key)) and cached[0] > now:
+            # Hand out a copy so callers cannot modify the cached values.
+            return cached[1]._replace(values=dict(cached[1].values))
+
+        generation = self._cache_generation
         response_text = await self._fetch_raw(name, params)
-        return self._parse_api_response(response_text)
+        response = self._parse_api_response(response_text)
+        if generation != self._cache_generation:
+            # The cache was cleared while the request was in flight, so the
+            # response may predate an update and must not be stored.
+            return response
+        # Drop expired entries so queries that are not repeated do not pile up.
+        self._cache = {
+            key: entry for key, entry in self._cache.items() if entry[0] > now
+        }
+        self._cache[cache_key] = (
+            monotonic() + self._cache_ttl,
+            response._replace(values=dict(response.values)),
+        )
+        return response
 
     async def login(self) -> None:
         """Authenticate with the Ouman EH-800 device.
@@ -163,13 +356,20 @@ class OumanEh800Client:
                 f"Unexpected response from login request: {response}"
             )
 
+    @staticmethod
+    def _warn_missing_values(
+        endpoint_ids: Sequence[str], response: _OumanResponse
+    ) -> None:
+        # All IDs are normally present, so do the check as one set difference
+        # and only loop when something is actually missing.
+        for endpoint_id in sorted(set(endpoint_ids).difference(response.values)):
+            _LOGGER.warning(
+                "Requested endpoint ID '%s' not found in response", endpoint_id
+            )
+
     async def _get_values(self, endpoint_ids: Sequence[str]) -> _OumanResponse:
         response = await self._fetch_parsed("request", endpoint_ids)
-        for endpoint_id in endpoint_ids:
-            if endpoint_id not in response.values:
-                _LOGGER.warning(
-                    "Requested endpoint ID '%s' not found in response", endpoint_id
-                )
+        self._warn_missing_values(endpoint_ids, response)
         return response
 
     async def get_values(
@@ -183,47 +383,75 @@ class OumanEh800Client:
         Returns:
             A dictionary mapping endpoints to their current values.
         """
-        response = await self._get_values(registry_set.sensor_endpoint_ids)
+        # The registry set keeps its IDs pre-joined into one request param.
+        joined_ids = registry_set.joined_sensor_endpoint_ids
+        response = await self._fetch_parsed(
+            "request", (joined_ids,) if joined_ids else ()
+        )
+        self._warn_missing_values(registry_set.sensor_endpoint_ids, response)
 
+        get_endpoint = registry_set.get_endpoint_by_sensor_id
         result: dict[OumanEndpoint, OumanValues] = {}
         for key, value in response.values.items():
-            endpoint = registry_set.get_endpoint_by_sensor_id(key)
+            endpoint = get_endpoint(key)
             if not endpoint:
-                _LOGGER.warning(f"Unexpected endpoint ID in response: '{key}'")
+                _LOGGER.warning("Unexpected endpoint ID in response: '%s'", key)
                 continue
-            parsed_value = endpoint.parse_value(value)
-            result[endpoint] = parsed_value
+            result[endpoint] = endpoint.parse_value(value)
 
         return result
 
+    async def get_all_values(self) -> dict[OumanEndpoint, OumanValues]:
+        """Get the values of every endpoint in the active registries.
+
+        All values are read in a single request.
+
+        Returns:
+            A dictionary mapping endpoints to their current values.
+        """
+        return await self.get_values(await self.get_active_registries())
+
+    async def _relogin(self, epoch: int) -> None:
+        # Updates that fail concurrently after the device session expired
+        # share a single login instead of each logging in again. `epoch` is
+        # the login epoch from before the failed request was sent, so a 404
+        # that arrives after another update already logged in is not retried
+        # with a second login.
+        async with self._login_lock:
+            if self._login_epoch == epoch:
+                await self.login()
+                self._login_epoch += 1
+
     async def _update_values(
         self, key_value_params: Mapping[str, str]
     ) -> _OumanResponse:
         request_path = "update"
-        params = [f"{key}={value}" for key, value in key_value_params.items()]
+        # Join the pairs once up front; the 404 retry below reuses the string.
+        params = (
+            ";".join([f"{key}={value}" for key, value in key_value_params.items()]),
+        )
+        login_epoch = self._login_epoch
         try:
             response = await self._fetch_parsed(request_path, params)
         except OumanClientCommunicationError as err:
-            if not isinstance(err.__cause__, aiohttp.ClientResponseError):
-                raise
-            if err.__cause__.status != 404:
+            if err.status != 404:
                 raise
             _LOGGER.debug("404 response from update request, logging in...")
-            await self.login()
+            await self._relogin(login_epoch)
             response = await self._fetch_parsed(request_path, params)
+        # Cached values may be stale after any successful update.
+        self._clear_cache()
         return response
 
-    async def _set_int_endpoint(
+    def _int_endpoint_params(
         self, endpoint: IntControlOumanEndpoint, value: int
-    ) -> float:
-        if not (endpoint.min_val <= value <= endpoint.max_val):
-            raise ValueError(
-                f"Value for {endpoint.name} out of bounds "
-                + f"[{endpoint.min_val},{endpoint.max_val}]: {value}"
-            )
-        params = {endpoint.control_endpoint_id: str(value)}
-        result = await self._update_values(params)
+    ) -> dict[str, str]:
+        _check_bounds(endpoint, value)
+        return {endpoint.control_endpoint_id: str(value)}
 
+    def _check_int_endpoint_result(
+        self, endpoint: IntControlOumanEndpoint, value: int, result: _OumanResponse
+    ) -> float:
         if not (result_value := result.values.get(endpoint.sensor_endpoint_id)):
             raise OumanClientError(
                 f"Endpoint ID missing from set int endpoint response: {result}"
@@ -244,21 +472,21 @@ class OumanEh800Client:
 
         return float_result
 
-    async def _set_float_endpoint(
+    def _float_endpoint_params(
         self, endpoint: FloatControlOumanEndpoint, value: float
-    ) -> float:
-        """Sets an endpoint value for endpoints which accept floating
-        point numbers. Values are rounded to the precision of one
-        decimal."""
-        if not (endpoint.min_val <= value <= endpoint.max_val):
-            raise ValueError(
-                f"Value for {endpoint.name} out of bounds "
-                + f"[{endpoint.min_val},{endpoint.max_val}]: {value}"
-            )
+    ) -> tuple[dict[str, str], float]:
+        """Returns the params along with the value rounded to the precision
+        of one decimal, which is what gets sent to the device."""
+        _check_bounds(endpoint, value)
         rounded_value = round(value, 1)
-        params = {endpoint.control_endpoint_id: str(round(value, 1))}
-        result = await self._update_values(params)
+        return {endpoint.control_endpoint_id: str(rounded_value)}, rounded_value
 
+    def _check_float_endpoint_result(
+        self,
+        endpoint: FloatControlOumanEndpoint,
+        rounded_value: float,
+        result: _OumanResponse,
+    ) -> float:
         if not (result_value := result.values.get(endpoint.sensor_endpoint_id)):
             raise OumanClientError(
                 f"Endpoint ID missing from set float endpoint response: {result}"
@@ -274,33 +502,43 @@ class OumanEh800Client:
         if float_result != rounded_value:
             raise OumanClientError(
                 "Returned float does not match set value. "
-                + f"Got {result_value}, expected {value}"
+                + f"Got {result_value}, expected {rounded_value}"
             )
 
         return float_result
 
-    async def _set_enum_endpoint(
+    def _enum_endpoint_params(
         self, endpoint: EnumControlOumanEndpoint, value: ControlEnum
-    ) -> ControlEnum:
+    ) -> dict[str, str]:
         if not isinstance(value, endpoint.enum_type):
             raise TypeError(
                 f"Unexpected type for {endpoint.name} value. "
                 + f"Expected {endpoint.enum_type}, got {value}."
             )
-        params = {endpoint_id: value for endpoint_id in endpoint.control_endpoint_ids}
-        result = await self._update_values(params)
+        return dict.fromkeys(endpoint.control_endpoint_ids, value)
 
+    def _check_enum_endpoint_result(
+        self,
+        endpoint: EnumControlOumanEndpoint,
+        value: ControlEnum,
+        result: _OumanResponse,
+    ) -> ControlEnum:
+        result_values = result.values
         result_value = None
         for endpoint_id in endpoint.response_endpoint_ids:
-            if not (result_value := result.values.get(endpoint_id)):
+            if not (result_value := result_values.get(endpoint_id)):
                 raise OumanClientError(
                     f"Endpoint ID missing from set enum endpoint response: {result}"
                 )
+            if result_value != value:
+                raise OumanClientError(
+                    "Returned value does not match str enum value. "
+                    + f"Got '{result_value}', expected '{value}'"
+                )
 
-        if result_value is None or result_value != value:
+        if result_value is None:
             raise OumanClientError(
-                "Returned value does not match str enum value. "
-                + f"Got '{result_value}', expected '{value}'"
+                f"Endpoint {endpoint.name} has no response endpoint IDs to check"
             )
         try:
             enum_result = endpoint.parse_value(result_value)
@@ -310,28 +548,17 @@ class OumanEh800Client:
             ) from err
         return enum_result
 
-    async def set_endpoint_value(
-        self,
-        endpoint: ControllableEndpoint,
-        value: OumanValues | int,
-    ) -> OumanValues:
-        """Set a value for a controllable endpoint.
+    def _prepare_update(
+        self, endpoint: ControllableEndpoint, value: OumanValues | int
+    ) -> tuple[dict[str, str], _ResultCheck]:
+        """Validate a value for an endpoint.
 
-        Args:
-            endpoint: The controllable endpoint to set.
-            value: The value to set for the endpoint.
-
-        Returns:
-            The confirmed value from the device.
-
-        Raises:
-            TypeError: If the endpoint is not controllable or value type is wrong.
-            ValueError: If the value is out of bounds.
+        Returns the update params for the value and a function which checks
+        the device's response to the update.
         """
         if not isinstance(endpoint, ControllableEndpoint):  # pyright: ignore[reportUnnecessaryIsInstance]
             raise TypeError(f"Endpoint {endpoint} is not a controllable endpoint.")  # pyright: ignore[reportUnreachable]
 
-        result: OumanValues
         if isinstance(endpoint, IntControlOumanEndpoint):
             if not isinstance(value, int | float):
                 raise TypeError(
@@ -342,27 +569,91 @@ class OumanEh800Client:
                 raise ValueError(
                     f"Value for {endpoint.name} must be an integer, got {value}"
                 )
-            result = await self._set_int_endpoint(endpoint, int(value))
+            int_value = int(value)
+            return self._int_endpoint_params(endpoint, int_value), partial(
+                self._check_int_endpoint_result, endpoint, int_value
+            )
         elif isinstance(endpoint, FloatControlOumanEndpoint):
             if not isinstance(value, int | float):
                 raise TypeError(
                     f"Value for {endpoint.name} must be numeric, "
                     + f"got {type(value).__name__}"
                 )
-            result = await self._set_float_endpoint(endpoint, value)
+            params, rounded_value = self._float_endpoint_params(endpoint, value)
+            return params, partial(
+                self._check_float_endpoint_result, endpoint, rounded_value
+            )
         elif isinstance(endpoint, EnumControlOumanEndpoint):
             if not isinstance(value, ControlEnum):
                 raise TypeError(
                     f"Value for {endpoint.name} must be a ControlEnum, "
                     + f"got {type(value).__name__}"
                 )
-            result = await self._set_enum_endpoint(endpoint, value)
+            return self._enum_endpoint_params(endpoint, value), partial(
+                self._check_enum_endpoint_result, endpoint, value
+            )
         else:
             raise NotImplementedError(
                 f"No control handler implemented for {type(endpoint).__name__}"
             )
 
-        return result
+    async def set_endpoint_value(
+        self,
+        endpoint: ControllableEndpoint,
+        value: OumanValues | int,
+    ) -> OumanValues:
+        """Set a value for a controllable endpoint.
+
+        Args:
+            endpoint: The controllable endpoint to set.
+            value: The value to set for the endpoint.
+
+        Returns:
+            The confirmed value from the device.
+
+        Raises:
+            TypeError: If the endpoint is not controllable or value type is wrong.
+            ValueError: If the value is out of bounds.
+        """
+        params, check_result = self._prepare_update(endpoint, value)
+        result = await self._update_values(params)
+        return check_result(result)
+
+    async def set_endpoint_values(
+        self, values: Mapping[ControllableEndpoint, OumanValues | int]
+    ) -> dict[ControllableEndpoint, OumanValues]:
+        """Set values for multiple controllable endpoints in a single request.
+
+        All values are validated before anything is sent to the device.
+
+        Args:
+            values: A mapping of controllable endpoints to the values to set.
+
+        Returns:
+            A dictionary mapping the endpoints to their confirmed values.
+
+        Raises:
+            TypeError: If an endpoint is not controllable or a value type is wrong.
+            ValueError: If a value is out of bounds, or two endpoints write to
+                the same control endpoint ID.
+        """
+        params: dict[str, str] = {}
+        checks: dict[ControllableEndpoint, _ResultCheck] = {}
+        for endpoint, value in values.items():
+            endpoint_params, checks[endpoint] = self._prepare_update(endpoint, value)
+            if conflicting := params.keys() & endpoint_params.keys():
+                raise ValueError(
+                    f"Multiple values for control endpoint IDs: {conflicting}"
+                )
+            params.update(endpoint_params)
+
+        if not params:
+            return {}
+
+        result = await self._update_values(params)
+        return {
+            endpoint: check_result(result) for endpoint, check_result in checks.items()
+        }
 
     async def get_is_l2_installed(self) -> bool:
         """Check if the L2 heating circuit is installed.
@@ -370,26 +661,12 @@ class OumanEh800Client:
         Returns:
             True if L2 is installed, False otherwise.
         """
-        endpoint_id = SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id
-        response = await self._get_values([endpoint_id])
-        value = response.values.get(endpoint_id)
-        if value is None:
-            raise ValueError("Response value should be defined")
-
-        # Observed values: '0' (L2 disabled), '1' (L2 enabled in software).
-        return value == "1"
+        response = await self._get_values([_L2_INSTALLED_ID])
+        return _is_l2_installed_value(_require_value(response, _L2_INSTALLED_ID))
 
     async def _get_is_room_sensor_installed(self, endpoint_id: str) -> bool:
         response = await self._get_values([endpoint_id])
-        value = response.values.get(endpoint_id)
-        if value is None:
-            raise ValueError("Response value should be defined")
-
-        # The device may return composite values like "on,error" (sensor
-        # configured but reporting fault) or "off,error" (channel disabled
-        # with error flag retained). Only the prefix indicates whether a
-        # sensor is configured.
-        return value.split(",")[0] == "on"
+        return _is_room_sensor_installed_value(_require_value(response, endpoint_id))
 
     async def get_is_l1_room_sensor_installed(self) -> bool:
         """Check if a room sensor is installed for the L1 heating circuit.
@@ -397,9 +674,7 @@ class OumanEh800Client:
         Returns:
             True if a room sensor is installed, False otherwise.
         """
-        return await self._get_is_room_sensor_installed(
-            L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
-        )
+        return await self._get_is_room_sensor_installed(_L1_ROOM_SENSOR_INSTALLED_ID)
 
     async def get_is_l2_room_sensor_installed(self) -> bool:
         """Check if a room sensor is installed for the L2 heating circuit.
@@ -407,9 +682,7 @@ class OumanEh800Client:
         Returns:
             True if a room sensor is installed, False otherwise.
         """
-        return await self._get_is_room_sensor_installed(
-            L2BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
-        )
+        return await self._get_is_room_sensor_installed(_L2_ROOM_SENSOR_INSTALLED_ID)
 
     async def _is_l1_five_point_curve(self) -> bool:
         # The 5-point curve uses a disjoint set of sensor IDs from the
@@ -432,36 +705,72 @@ class OumanEh800Client:
                 return fragment
         return None
 
+    def invalidate_registry_cache(self) -> None:
+        """Forget the cached result of `get_active_registries()`.
+
+        Call this after changing the device configuration, e.g. installing
+        a room sensor or enabling L2. Cached responses are cleared as well,
+        so the next discovery reads the probes from the device.
+        """
+        self._registry_cache = None
+        self._clear_cache()
+
     async def get_active_registries(self) -> OumanRegistrySet:
         """Get the list of active registries which contain the sets of
         endpoints that can currently be read and written to."""
+        if self._registry_cache_ttl > 0 and self._registry_cache is not None:
+            cached_at, registry_set = self._registry_cache
+            if monotonic() - cached_at < self._registry_cache_ttl:
+                return registry_set
+
+        registry_set = await self._discover_registries()
+        if self._registry_cache_ttl > 0:
+            self._registry_cache = (monotonic(), registry_set)
+        return registry_set
+
+    async def _discover_registries(self) -> OumanRegistrySet:
         registries: list[type[OumanRegistry]] = [SystemEndpoints, L1BaseEndpoints]
 
-        if await self._is_l1_five_point_curve():
+        # The room sensor and L2 flags are read in one request, concurrently
+        # with the other independent probes.
+        l1_five_point_curve, probe, relay_fragment = await asyncio.gather(
+            self._is_l1_five_point_curve(),
+            self._get_values(_REGISTRY_PROBE_SENSOR_IDS),
+            self._get_relay_fragment(),
+        )
+
+        if l1_five_point_curve:
             registries.append(L1FivePointCurve)
         else:
             registries.append(L1ThreePointCurve)
 
-        if await self.get_is_l1_room_sensor_installed():
+        if _is_room_sensor_installed_value(
+            _require_value(probe, _L1_ROOM_SENSOR_INSTALLED_ID)
+        ):
             registries.append(L1RoomSensor)
         else:
             registries.append(L1NoRoomSensor)
 
-        if await self.get_is_l2_installed():
+        if _is_l2_installed_value(_require_value(probe, _L2_INSTALLED_ID)):
             registries.append(L2BaseEndpoints)
             if await self._is_l2_five_point_curve():
                 registries.append(L2FivePointCurve)
             else:
                 registries.append(L2ThreePointCurve)
-            if await self.get_is_l2_room_sensor_installed():
+            # A missing L2 room sensor value has already been logged by
+            # _get_values and is treated as no room sensor installed.
+            l2_room_sensor = probe.values.get(_L2_ROOM_SENSOR_INSTALLED_ID)
+            if l2_room_sensor is not None and _is_room_sensor_installed_value(
+                l2_room_sensor
+            ):
                 registries.append(L2RoomSensor)
             else:
                 registries.append(L2NoRoomSensor)
 
-        if (relay_fragment := await self._get_relay_fragment()) is not None:
+        if relay_fragment is not None:
             registries.append(relay_fragment)
 
-        return OumanRegistrySet(registries)
+        return _registry_set(tuple(registries))
 
     async def get_alarms(self) -> Mapping[str, str]:
         """Get all active alarms from the device.
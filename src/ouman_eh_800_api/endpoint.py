@@ -1,11 +1,11 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import override
+from typing import cast, override
 
 from .const import ControlEnum, OumanUnit, OumanValues
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OumanEndpoint:
     """Base class for all Ouman device endpoints.
 
@@ -26,18 +26,20 @@ class OumanEndpoint:
 class ControllableEndpoint(OumanEndpoint):
     """Base marker class for all writable endpoints."""
 
-    pass
+    __slots__ = ()
 
 
 class NumberOumanEndpoint(OumanEndpoint):
     """Endpoint that returns numeric (float) values."""
 
+    __slots__ = ()
+
     @override
     def parse_value(self, value: str) -> float:
         return float(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnumControlOumanEndpoint(ControllableEndpoint):
     """Controllable endpoint that accepts enum values.
 
@@ -47,16 +49,33 @@ class EnumControlOumanEndpoint(ControllableEndpoint):
         enum_type: The enum class for valid values.
     """
 
-    control_endpoint_ids: Sequence[str]
-    response_endpoint_ids: Sequence[str]
+    control_endpoint_ids: tuple[str, ...]
+    response_endpoint_ids: tuple[str, ...]
     enum_type: type[ControlEnum]
 
+    def __post_init__(self) -> None:
+        # A parenthesized single ID without a trailing comma is a plain str,
+        # which would otherwise be iterated character by character.
+        for field_name in ("control_endpoint_ids", "response_endpoint_ids"):
+            ids: Sequence[str] = getattr(self, field_name)
+            if isinstance(ids, str):
+                raise TypeError(
+                    f"{field_name} of {self.name} must be a sequence of IDs, "
+                    + f"got the string '{ids}'"
+                )
+            object.__setattr__(self, field_name, tuple(ids))
+
     @override
     def parse_value(self, value: str) -> ControlEnum:
-        return self.enum_type(value)
+        # Look the member up directly instead of going through Enum.__call__,
+        # which is only needed to raise the ValueError for unknown values.
+        member = self.enum_type._value2member_map_.get(value)
+        if member is None:
+            return self.enum_type(value)
+        return cast(ControlEnum, member)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntControlOumanEndpoint(NumberOumanEndpoint, ControllableEndpoint):
     """Controllable endpoint that accepts integer values.
 
@@ -71,7 +90,7 @@ class IntControlOumanEndpoint(NumberOumanEndpoint, ControllableEndpoint):
     max_val: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FloatControlOumanEndpoint(NumberOumanEndpoint, ControllableEndpoint):
     """Controllable endpoint that accepts float values.
 
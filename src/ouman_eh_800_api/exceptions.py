@@ -11,6 +11,13 @@ class OumanClientAuthenticationError(OumanClientError):
 
 
 class OumanClientCommunicationError(OumanClientError):
-    """Raised when communication with the device fails."""
+    """Raised when communication with the device fails.
 
-    pass
+    Attributes:
+        status: HTTP status code of the failed response, or None if the
+            request failed before a response was received.
+    """
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status: int | None = status
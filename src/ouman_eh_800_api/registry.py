@@ -1,7 +1,7 @@
-from collections.abc import Generator, Mapping, Sequence
-from dataclasses import dataclass
-from functools import cached_property
-from typing import final
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, ClassVar, final
 
 from .const import (
     HomeAwayControl,
@@ -19,57 +19,122 @@ from .endpoint import (
 )
 
 
+def _curve_temperature_endpoint(
+    name: str, sensor_endpoint_id: str
+) -> IntControlOumanEndpoint:
+    """Heating curve setpoint; every curve point has the same unit and range."""
+    return IntControlOumanEndpoint(
+        name=name,
+        unit=OumanUnit.CELSIUS,
+        sensor_endpoint_id=sensor_endpoint_id,
+        control_endpoint_id=f"@_{sensor_endpoint_id}",
+        min_val=0,
+        max_val=99,
+    )
+
+
 class OumanRegistry:
     """Base class for endpoint registry definitions.
 
     Subclasses define endpoints as class attributes.
     """
 
+    _endpoints: ClassVar[tuple[OumanEndpoint, ...]] = ()
+    _sensor_id_endpoint_map: ClassVar[Mapping[str, OumanEndpoint]] = MappingProxyType(
+        {}
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Endpoints are static class attributes, so they only need to be
+        # collected once when the registry class is created.
+        cls._endpoints = tuple(
+            value
+            for value in cls.__dict__.values()  # pyright: ignore[reportAny]
+            if isinstance(value, OumanEndpoint)
+        )
+        # The map is shared class state, so expose it read-only.
+        cls._sensor_id_endpoint_map = MappingProxyType(
+            {endpoint.sensor_endpoint_id: endpoint for endpoint in cls._endpoints}
+        )
+
     @classmethod
-    def iterate_endpoints(cls) -> Generator[OumanEndpoint]:
+    def iterate_endpoints(cls) -> Iterator[OumanEndpoint]:
         """Iterate over the OumanEndpoints defined directly on this class."""
-        for value in cls.__dict__.values():  # pyright: ignore[reportAny]
-            if isinstance(value, OumanEndpoint):
-                yield value
+        return iter(cls._endpoints)
 
+    @classmethod
+    def endpoints(cls) -> tuple[OumanEndpoint, ...]:
+        """The OumanEndpoints defined directly on this class."""
+        return cls._endpoints
 
-@dataclass
+    @classmethod
+    def get_endpoint_by_sensor_id(cls, id: str) -> OumanEndpoint | None:
+        return cls._sensor_id_endpoint_map.get(id)
+
+    @classmethod
+    def contains_sensor_id(cls, id: str) -> bool:
+        return id in cls._sensor_id_endpoint_map
+
+
+@dataclass(frozen=True, slots=True)
 class OumanRegistrySet:
     """A collection of registries for querying endpoint values.
 
     Use this to group registries when calling client.get_values().
     Validates that registries don't have conflicting endpoint IDs.
+
+    Attributes:
+        registries: The registries in the set, stored as a tuple.
+        endpoints: All the endpoints in the registry set.
+        sensor_endpoint_ids: The sensor IDs of all the endpoints.
+        joined_sensor_endpoint_ids: The sensor IDs joined into a single
+            request parameter.
     """
 
     registries: Sequence[type[OumanRegistry]]
+    endpoints: Sequence[OumanEndpoint] = field(init=False, repr=False, compare=False)
+    sensor_endpoint_ids: Sequence[str] = field(init=False, repr=False, compare=False)
+    joined_sensor_endpoint_ids: str = field(init=False, repr=False, compare=False)
+    _sensor_id_endpoint_map: Mapping[str, OumanEndpoint] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        if len(self.registries) > len(set(self.registries)):
-            raise ValueError("Multiple of the same registry passed")
-
-        if len(self.endpoints) > len(self._sensor_id_endpoint_map):
-            raise ValueError("Conflicting endpoint IDs across registries")
-
-    @cached_property
-    def endpoints(self) -> Sequence[OumanEndpoint]:
-        """All the endpoints in the registry set."""
-        return [
-            endpoint
-            for registry in self.registries
-            for endpoint in registry.iterate_endpoints()
-        ]
-
-    @cached_property
-    def _sensor_id_endpoint_map(self) -> Mapping[str, OumanEndpoint]:
-        return {endpoint.sensor_endpoint_id: endpoint for endpoint in self.endpoints}
-
-    @cached_property
-    def sensor_endpoint_ids(self) -> Sequence[str]:
-        return [endpoint.sensor_endpoint_id for endpoint in self.endpoints]
+        # Store the registries as a tuple so sets built from a list and from a
+        # tuple compare equal and the set stays immutable.
+        registries = tuple(self.registries)
+        object.__setattr__(self, "registries", registries)
+
+        # Validate and build the lookups in a single pass over the endpoints.
+        seen_registries: set[type[OumanRegistry]] = set()
+        endpoints: list[OumanEndpoint] = []
+        sensor_id_endpoint_map: dict[str, OumanEndpoint] = {}
+        for registry in registries:
+            if registry in seen_registries:
+                raise ValueError("Multiple of the same registry passed")
+            seen_registries.add(registry)
+            for endpoint in registry.endpoints():
+                sensor_id = endpoint.sensor_endpoint_id
+                if sensor_id in sensor_id_endpoint_map:
+                    raise ValueError("Conflicting endpoint IDs across registries")
+                sensor_id_endpoint_map[sensor_id] = endpoint
+                endpoints.append(endpoint)
+
+        sensor_endpoint_ids = tuple(sensor_id_endpoint_map)
+        object.__setattr__(self, "endpoints", tuple(endpoints))
+        object.__setattr__(self, "_sensor_id_endpoint_map", sensor_id_endpoint_map)
+        object.__setattr__(self, "sensor_endpoint_ids", sensor_endpoint_ids)
+        object.__setattr__(
+            self, "joined_sensor_endpoint_ids", ";".join(sensor_endpoint_ids)
+        )
 
     def get_endpoint_by_sensor_id(self, id: str) -> OumanEndpoint | None:
         return self._sensor_id_endpoint_map.get(id)
 
+    def contains_sensor_id(self, id: str) -> bool:
+        return id in self._sensor_id_endpoint_map
+
 
 @final
 class SystemEndpoints(OumanRegistry):
@@ -215,31 +280,19 @@ class L1ThreePointCurve(OumanRegistry):
     `name` with the 5-point counterparts where they overlap (-20, 0, +20).
     """
 
-    CURVE_MINUS_20_TEMP = IntControlOumanEndpoint(
+    CURVE_MINUS_20_TEMP = _curve_temperature_endpoint(
         name="l1_curve_minus_20_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_61_85",
-        control_endpoint_id="@_S_61_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_0_TEMP = IntControlOumanEndpoint(
+    CURVE_0_TEMP = _curve_temperature_endpoint(
         name="l1_curve_0_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_63_85",
-        control_endpoint_id="@_S_63_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_20_TEMP = IntControlOumanEndpoint(
+    CURVE_20_TEMP = _curve_temperature_endpoint(
         name="l1_curve_20_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_65_85",
-        control_endpoint_id="@_S_65_85",
-        min_val=0,
-        max_val=99,
     )
 
 
@@ -253,49 +306,29 @@ class L1FivePointCurve(OumanRegistry):
     where they overlap (-20, 0, +20).
     """
 
-    CURVE_MINUS_20_TEMP = IntControlOumanEndpoint(
+    CURVE_MINUS_20_TEMP = _curve_temperature_endpoint(
         name="l1_curve_minus_20_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_67_85",
-        control_endpoint_id="@_S_67_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_MINUS_10_TEMP = IntControlOumanEndpoint(
+    CURVE_MINUS_10_TEMP = _curve_temperature_endpoint(
         name="l1_curve_minus_10_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_69_85",
-        control_endpoint_id="@_S_69_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_0_TEMP = IntControlOumanEndpoint(
+    CURVE_0_TEMP = _curve_temperature_endpoint(
         name="l1_curve_0_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_71_85",
-        control_endpoint_id="@_S_71_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_10_TEMP = IntControlOumanEndpoint(
+    CURVE_10_TEMP = _curve_temperature_endpoint(
         name="l1_curve_10_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_73_85",
-        control_endpoint_id="@_S_73_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_20_TEMP = IntControlOumanEndpoint(
+    CURVE_20_TEMP = _curve_temperature_endpoint(
         name="l1_curve_20_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_75_85",
-        control_endpoint_id="@_S_75_85",
-        min_val=0,
-        max_val=99,
     )
 
 
@@ -524,31 +557,19 @@ class L2ThreePointCurve(OumanRegistry):
     5-point counterparts where they overlap (-20, 0, +20).
     """
 
-    CURVE_MINUS_20_TEMP = IntControlOumanEndpoint(
+    CURVE_MINUS_20_TEMP = _curve_temperature_endpoint(
         name="l2_curve_minus_20_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_148_85",
-        control_endpoint_id="@_S_148_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_0_TEMP = IntControlOumanEndpoint(
+    CURVE_0_TEMP = _curve_temperature_endpoint(
         name="l2_curve_0_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_150_85",
-        control_endpoint_id="@_S_150_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_20_TEMP = IntControlOumanEndpoint(
+    CURVE_20_TEMP = _curve_temperature_endpoint(
         name="l2_curve_20_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_152_85",
-        control_endpoint_id="@_S_152_85",
-        min_val=0,
-        max_val=99,
     )
 
 
@@ -559,49 +580,29 @@ class L2FivePointCurve(OumanRegistry):
     Mutually exclusive with L2ThreePointCurve.
     """
 
-    CURVE_MINUS_20_TEMP = IntControlOumanEndpoint(
+    CURVE_MINUS_20_TEMP = _curve_temperature_endpoint(
         name="l2_curve_minus_20_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_154_85",
-        control_endpoint_id="@_S_154_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_MINUS_10_TEMP = IntControlOumanEndpoint(
+    CURVE_MINUS_10_TEMP = _curve_temperature_endpoint(
         name="l2_curve_minus_10_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_156_85",
-        control_endpoint_id="@_S_156_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_0_TEMP = IntControlOumanEndpoint(
+    CURVE_0_TEMP = _curve_temperature_endpoint(
         name="l2_curve_0_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_158_85",
-        control_endpoint_id="@_S_158_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_10_TEMP = IntControlOumanEndpoint(
+    CURVE_10_TEMP = _curve_temperature_endpoint(
         name="l2_curve_10_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_160_85",
-        control_endpoint_id="@_S_160_85",
-        min_val=0,
-        max_val=99,
     )
 
-    CURVE_20_TEMP = IntControlOumanEndpoint(
+    CURVE_20_TEMP = _curve_temperature_endpoint(
         name="l2_curve_20_temperature",
-        unit=OumanUnit.CELSIUS,
         sensor_endpoint_id="S_162_85",
-        control_endpoint_id="@_S_162_85",
-        min_val=0,
-        max_val=99,
     )
 
 
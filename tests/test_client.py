@@ -1,17 +1,20 @@
 import asyncio
-import re
-from collections.abc import AsyncGenerator
+import logging
+from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime
-from unittest.mock import MagicMock
 
 import aiohttp
 import pytest
 import pytest_asyncio
 from aiohttp import ClientSession
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 
 from ouman_eh_800_api.client import OumanEh800Client
 from ouman_eh_800_api.const import HomeAwayControl, OperationMode
+from ouman_eh_800_api.endpoint import (
+    EnumControlOumanEndpoint,
+    IntControlOumanEndpoint,
+)
 from ouman_eh_800_api.exceptions import (
     OumanClientAuthenticationError,
     OumanClientCommunicationError,
@@ -42,20 +45,37 @@ MOCK_USERNAME = "user"
 MOCK_PASSWORD = "password"
 
 
+MOCK_NOW = datetime(2026, 1, 6, 12, 0, 0, tzinfo=UTC).timestamp()
 MOCK_DATE_PARAM = (
     "Tue%252C+06+Jan+2026+12%253A00%253A00+GMT%253D"  # "Tue, 06 Jan 2026 12:00:00 GMT="
 )
 MOCK_LOGIN_URL = f"{MOCK_ADDRESS}/login?uid={MOCK_USERNAME}%253Bpwd%253D{MOCK_PASSWORD}%253B{MOCK_DATE_PARAM}"
 MOCK_LOGOUT_URL = f"{MOCK_ADDRESS}/logout?{MOCK_DATE_PARAM}"
 
+_L1_ROOM_SENSOR_INSTALLED_ID = L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
+_L2_INSTALLED_ID = SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id
+_L2_ROOM_SENSOR_INSTALLED_ID = L2BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
+
+_CONFLICTING_VALVE_ENDPOINT = IntControlOumanEndpoint(
+    name="test_conflicting_valve",
+    unit=None,
+    sensor_endpoint_id="S_TEST_1",
+    control_endpoint_id=L1BaseEndpoints.VALVE_POSITION_SETPOINT.control_endpoint_id,
+    min_val=0,
+    max_val=100,
+)
+
+_SYSTEM_REGISTRY_SET = OumanRegistrySet([SystemEndpoints])
+_SYSTEM_REQUEST_URL = (
+    f"{MOCK_ADDRESS}/request?"
+    f"{'%253B'.join(_SYSTEM_REGISTRY_SET.sensor_endpoint_ids)}%253B{MOCK_DATE_PARAM}"
+)
 
-@pytest.fixture(autouse=True)
-def mock_datetime_now_for_client(monkeypatch):
-    fake_now = datetime(2026, 1, 6, 12, 0, 0, tzinfo=UTC)
-    mock_dt = MagicMock(wraps=datetime)
-    mock_dt.now.return_value = fake_now
 
-    monkeypatch.setattr("ouman_eh_800_api.client.datetime", mock_dt)
+@pytest.fixture(autouse=True)
+def mock_time_for_client(monkeypatch):
+    monkeypatch.setattr("ouman_eh_800_api.client.time", lambda: MOCK_NOW)
+    monkeypatch.setattr("ouman_eh_800_api.client._gmt_string_param_cache", (0, ""))
 
 
 @pytest_asyncio.fixture
@@ -69,44 +89,79 @@ async def client(session: ClientSession) -> OumanEh800Client:
     )
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def session() -> AsyncGenerator[ClientSession]:
-    """Fixture for aiohttp session."""
+    """Fixture for aiohttp session, shared by all tests.
+
+    aioresponses intercepts every request, so no real connections are made
+    and one session can safely serve the whole run.
+    """
     async with ClientSession() as sess:
         yield sess
 
 
-@pytest_asyncio.fixture
-async def m() -> AsyncGenerator[aioresponses]:
-    """Fixture for aioresponses for mocking aiohttp requests."""
+@pytest.fixture(scope="session")
+def _aioresponses_patch() -> Generator[aioresponses]:
+    """Install the aioresponses patch once for the whole run."""
     with aioresponses() as mock:
         yield mock
 
 
-@pytest.mark.asyncio
-async def test_login_success(client: OumanEh800Client, m: aioresponses):
-    m.get(
-        MOCK_LOGIN_URL,
-        body="login?result=ok;\x00",
-        status=200,
-    )
+@pytest.fixture
+def m(_aioresponses_patch: aioresponses) -> Generator[aioresponses]:
+    """Fixture for aioresponses for mocking aiohttp requests.
 
-    await client.login()
+    Registered mocks and recorded requests are reset after each test.
+    """
+    yield _aioresponses_patch
+    _aioresponses_patch.clear()
+    _aioresponses_patch.requests.clear()
 
 
-@pytest.mark.asyncio
-async def test_login_failure(client: OumanEh800Client, m: aioresponses):
-    m.get(
-        MOCK_LOGIN_URL,
-        body="login?result=error;\x00",
-        status=200,
-    )
+@pytest.mark.parametrize(
+    "method,url,body",
+    [
+        ("login", MOCK_LOGIN_URL, "login?result=ok;\x00"),
+        ("logout", MOCK_LOGOUT_URL, "logout?result=ok;\x00"),
+    ],
+    ids=["login", "logout"],
+)
+async def test_auth_success(
+    client: OumanEh800Client, m: aioresponses, method: str, url: str, body: str
+):
+    m.get(url, body=body, status=200)
 
-    with pytest.raises(OumanClientAuthenticationError):
-        await client.login()
+    await getattr(client, method)()
+
+
+@pytest.mark.parametrize(
+    "method,url,body,expected_exc",
+    [
+        (
+            "login",
+            MOCK_LOGIN_URL,
+            "login?result=error;\x00",
+            OumanClientAuthenticationError,
+        ),
+        ("login", MOCK_LOGIN_URL, "login?foo=bar;\x00", OumanClientError),
+        ("logout", MOCK_LOGOUT_URL, "logout?result=error;\x00", OumanClientError),
+    ],
+    ids=["login_wrong_credentials", "login_unexpected", "logout"],
+)
+async def test_auth_failure(
+    client: OumanEh800Client,
+    m: aioresponses,
+    method: str,
+    url: str,
+    body: str,
+    expected_exc: type[Exception],
+):
+    m.get(url, body=body, status=200)
+
+    with pytest.raises(expected_exc):
+        await getattr(client, method)()
 
 
-@pytest.mark.asyncio
 async def test_login_timeout(client: OumanEh800Client, m: aioresponses):
     m.get(MOCK_LOGIN_URL, exception=asyncio.TimeoutError)
 
@@ -114,27 +169,60 @@ async def test_login_timeout(client: OumanEh800Client, m: aioresponses):
         await client.login()
 
 
-@pytest.mark.asyncio
-async def test_logout_success(client: OumanEh800Client, m: aioresponses):
-    m.get(
-        MOCK_LOGOUT_URL,
-        body="logout?result=ok;\x00",
-        status=200,
+async def test_create_owns_session():
+    client = await OumanEh800Client.create(MOCK_ADDRESS, MOCK_USERNAME, MOCK_PASSWORD)
+    session = client._session
+
+    assert session.connector is not None
+    assert session.connector.limit_per_host == 4
+    assert not session.closed
+
+    await client.close()
+
+    assert session.closed
+
+
+async def test_create_applies_connector_limits():
+    client = await OumanEh800Client.create(
+        MOCK_ADDRESS,
+        MOCK_USERNAME,
+        MOCK_PASSWORD,
+        limit_per_host=2,
+        keepalive_timeout=30,
     )
+    connector = client._session.connector
 
-    await client.logout()
+    assert isinstance(connector, aiohttp.TCPConnector)
+    assert connector.limit_per_host == 2
+    assert connector._keepalive_timeout == 30
 
+    await client.close()
 
-@pytest.mark.asyncio
-async def test_logout_failure(client: OumanEh800Client, m: aioresponses):
-    m.get(
-        MOCK_LOGIN_URL,
-        body="logout?result=error;\x00",
-        status=200,
+
+async def test_request_timeout_passed_to_request(
+    session: ClientSession, m: aioresponses
+):
+    client = OumanEh800Client(
+        session=session,
+        address=MOCK_ADDRESS,
+        username=MOCK_USERNAME,
+        password=MOCK_PASSWORD,
+        request_timeout=3,
     )
+    m.get(MOCK_LOGOUT_URL, body="logout?result=ok;\x00", status=200)
+
+    await client.logout()
+
+    [call] = next(iter(m.requests.values()))
+    assert call.kwargs["timeout"].total == 3
+
+
+async def test_close_leaves_external_session_open(
+    client: OumanEh800Client, session: ClientSession
+):
+    await client.close()
 
-    with pytest.raises(OumanClientError):
-        await client.logout()
+    assert not session.closed
 
 
 @pytest.mark.parametrize(
@@ -165,6 +253,19 @@ def test_parse_response(response_text: str, prefix: str, params_n: int):
         assert value in response_text
 
 
+def test_parse_response_skips_malformed_pair(caplog):
+    caplog.set_level(logging.WARNING, logger="ouman_eh_800_api")
+
+    parsed_response = OumanEh800Client._parse_api_response(
+        "request?S_227_85=-13.3;garbage;S_259_85=39.1;\x00"
+    )
+
+    assert parsed_response.values == {"S_227_85": "-13.3", "S_259_85": "39.1"}
+    assert [r.getMessage() for r in caplog.records] == [
+        "Skipping malformed key value pair in Ouman response: 'garbage'"
+    ]
+
+
 # =============================================================================
 # Tests for _construct_request_path
 # =============================================================================
@@ -188,35 +289,51 @@ def test_construct_request_path_empty_params(client: OumanEh800Client):
     assert "GMT" in path
 
 
+def test_construct_request_path_gmt_string_cached_per_second(
+    client: OumanEh800Client, monkeypatch
+):
+    now = datetime(2026, 1, 6, 12, 0, 0, tzinfo=UTC).timestamp()
+    monkeypatch.setattr("ouman_eh_800_api.client.time", lambda: now + 0.5)
+    first = client._construct_request_path("alarms", [])
+    assert first.endswith("Tue, 06 Jan 2026 12:00:00 GMT=")
+    assert client._construct_request_path("alarms", []) == first
+
+    monkeypatch.setattr("ouman_eh_800_api.client.time", lambda: now + 1)
+    second = client._construct_request_path("alarms", [])
+    assert second.endswith("Tue, 06 Jan 2026 12:00:01 GMT=")
+
+
 # =============================================================================
 # Tests for _request (HTTP and network errors)
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_request_http_error(client: OumanEh800Client, m: aioresponses):
     m.get(
         f"{MOCK_ADDRESS}/request?S_227_85%253B{MOCK_DATE_PARAM}",
         status=500,
     )
 
-    with pytest.raises(OumanClientCommunicationError) as exc_info:
+    with pytest.raises(
+        OumanClientCommunicationError, match="HTTP Error: 500"
+    ) as exc_info:
         await client._fetch_parsed("request", ["S_227_85"])
 
-    assert "HTTP Error: 500" in str(exc_info.value)
+    assert exc_info.value.status == 500
 
 
-@pytest.mark.asyncio
 async def test_request_network_error(client: OumanEh800Client, m: aioresponses):
     m.get(
         f"{MOCK_ADDRESS}/request?S_227_85%253B{MOCK_DATE_PARAM}",
         exception=aiohttp.ClientError("Connection refused"),
     )
 
-    with pytest.raises(OumanClientCommunicationError) as exc_info:
+    with pytest.raises(
+        OumanClientCommunicationError, match="Network error"
+    ) as exc_info:
         await client._fetch_parsed("request", ["S_227_85"])
 
-    assert "Network error" in str(exc_info.value)
+    assert exc_info.value.status is None
 
 
 # =============================================================================
@@ -224,7 +341,6 @@ async def test_request_network_error(client: OumanEh800Client, m: aioresponses):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_get_values_success(client: OumanEh800Client, m: aioresponses):
     m.get(
         f"{MOCK_ADDRESS}/request?S_227_85%253BS_259_85%253B{MOCK_DATE_PARAM}",
@@ -239,10 +355,10 @@ async def test_get_values_success(client: OumanEh800Client, m: aioresponses):
     assert response.values["S_259_85"] == "39.1"
 
 
-@pytest.mark.asyncio
 async def test_get_values_missing_endpoint_logs_warning(
     client: OumanEh800Client, m: aioresponses, caplog
 ):
+    caplog.set_level(logging.WARNING, logger="ouman_eh_800_api")
     m.get(
         f"{MOCK_ADDRESS}/request?S_227_85%253BS_259_85%253B{MOCK_DATE_PARAM}",
         body="request?S_227_85=-13.3;\x00",  # S_259_85 is missing
@@ -251,8 +367,176 @@ async def test_get_values_missing_endpoint_logs_warning(
 
     await client._get_values(["S_227_85", "S_259_85"])
 
-    assert "S_259_85" in caplog.text
-    assert "not found in response" in caplog.text
+    assert [r.getMessage() for r in caplog.records] == [
+        "Requested endpoint ID 'S_259_85' not found in response"
+    ]
+
+
+# =============================================================================
+# Tests for the response cache
+# =============================================================================
+
+
+@pytest_asyncio.fixture
+async def caching_client(session: ClientSession) -> OumanEh800Client:
+    return OumanEh800Client(
+        session=session,
+        address=MOCK_ADDRESS,
+        username=MOCK_USERNAME,
+        password=MOCK_PASSWORD,
+        cache_ttl=5,
+    )
+
+
+async def test_cache_reuses_response_within_ttl(
+    caching_client: OumanEh800Client, m: aioresponses, monkeypatch
+):
+    m.get(
+        f"{MOCK_ADDRESS}/request?S_227_85%253B{MOCK_DATE_PARAM}",
+        body="request?S_227_85=-13.3;\x00",
+        status=200,
+        repeat=True,
+    )
+    monkeypatch.setattr("ouman_eh_800_api.client.monotonic", lambda: 100.0)
+
+    first = await caching_client._get_values(["S_227_85"])
+    second = await caching_client._get_values(["S_227_85"])
+
+    assert second == first
+    [calls] = m.requests.values()
+    assert len(calls) == 1
+
+    monkeypatch.setattr("ouman_eh_800_api.client.monotonic", lambda: 105.0)
+    await caching_client._get_values(["S_227_85"])
+
+    assert len(calls) == 2
+
+
+async def test_cache_cleared_by_update(
+    caching_client: OumanEh800Client, m: aioresponses
+):
+    m.get(
+        f"{MOCK_ADDRESS}/request?S_92_85%253B{MOCK_DATE_PARAM}",
+        body="request?S_92_85=40;\x00",
+        status=200,
+    )
+    m.get(
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
+        body="update?S_92_85=50.0;\x00",
+        status=200,
+    )
+    m.get(
+        f"{MOCK_ADDRESS}/request?S_92_85%253B{MOCK_DATE_PARAM}",
+        body="request?S_92_85=50;\x00",
+        status=200,
+    )
+
+    before = await caching_client._get_values(["S_92_85"])
+    await caching_client._update_values({"S_92_85": "50"})
+    after = await caching_client._get_values(["S_92_85"])
+
+    assert before.values["S_92_85"] == "40"
+    assert after.values["S_92_85"] == "50"
+
+
+async def test_cache_skips_read_that_overlaps_an_update(
+    caching_client: OumanEh800Client, m: aioresponses
+):
+    reads = 0
+    update_done = asyncio.Event()
+
+    async def read_callback(url, **kwargs):
+        nonlocal reads
+        reads += 1
+        if reads == 1:
+            # The first read is slow and answers with the pre-update value.
+            await update_done.wait()
+            return CallbackResult(body="request?S_92_85=40;\x00")
+        return CallbackResult(body="request?S_92_85=50;\x00")
+
+    m.get(
+        f"{MOCK_ADDRESS}/request?S_92_85%253B{MOCK_DATE_PARAM}",
+        callback=read_callback,
+        repeat=True,
+    )
+    m.get(
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
+        body="update?S_92_85=50.0;\x00",
+        status=200,
+    )
+
+    slow_read = asyncio.create_task(caching_client._get_values(["S_92_85"]))
+    while not reads:
+        await asyncio.sleep(0)
+    await caching_client._update_values({"S_92_85": "50"})
+    update_done.set()
+    await slow_read
+    after = await caching_client._get_values(["S_92_85"])
+
+    assert after.values["S_92_85"] == "50"
+
+
+async def test_cache_shares_entry_for_joined_and_separate_ids(
+    caching_client: OumanEh800Client, m: aioresponses
+):
+    registry_set = OumanRegistrySet([SystemEndpoints])
+    m.get(
+        _SYSTEM_REQUEST_URL,
+        body="request?S_26_85=600;S_135_85=0;S_227_85=-13.3;S_1002_85=test;S_1004_85=ok;S_140_85=0;\x00",
+        status=200,
+    )
+
+    await caching_client.get_values(registry_set)
+    await caching_client._get_values(registry_set.sensor_endpoint_ids)
+
+    [calls] = m.requests.values()
+    assert len(calls) == 1
+
+
+async def test_cache_evicts_expired_entries(
+    caching_client: OumanEh800Client, m: aioresponses, monkeypatch
+):
+    _mock_request(m, "S_227_85", "-13.3")
+    _mock_request(m, "S_259_85", "39.1")
+    monkeypatch.setattr("ouman_eh_800_api.client.monotonic", lambda: 100.0)
+    await caching_client._get_values(["S_227_85"])
+
+    monkeypatch.setattr("ouman_eh_800_api.client.monotonic", lambda: 105.0)
+    await caching_client._get_values(["S_259_85"])
+
+    assert list(caching_client._cache) == [("request", "S_259_85")]
+
+
+async def test_cached_alarms_are_not_shared_with_callers(
+    caching_client: OumanEh800Client, m: aioresponses
+):
+    m.get(
+        f"{MOCK_ADDRESS}/alarms?{MOCK_DATE_PARAM}",
+        body="alarms?alarm1=test;\x00",
+        status=200,
+    )
+
+    alarms = await caching_client.get_alarms()
+    alarms["alarm1"] = "changed"  # type: ignore[index]
+    cached_alarms = await caching_client.get_alarms()
+
+    assert isinstance(cached_alarms, dict)
+    assert cached_alarms == {"alarm1": "test"}
+
+
+async def test_cache_disabled_by_default(client: OumanEh800Client, m: aioresponses):
+    m.get(
+        f"{MOCK_ADDRESS}/alarms?{MOCK_DATE_PARAM}",
+        body="alarms?alarm1=test;\x00",
+        status=200,
+        repeat=True,
+    )
+
+    await client.get_alarms()
+    await client.get_alarms()
+
+    [calls] = m.requests.values()
+    assert len(calls) == 2
 
 
 # =============================================================================
@@ -260,10 +544,9 @@ async def test_get_values_missing_endpoint_logs_warning(
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_update_values_success(client: OumanEh800Client, m: aioresponses):
     m.get(
-        re.compile(r".*/update\?S_92_85.*50.*"),
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
         body="update?S_92_85=50.0;\x00",
         status=200,
     )
@@ -273,13 +556,12 @@ async def test_update_values_success(client: OumanEh800Client, m: aioresponses):
     assert response.values["S_92_85"] == "50.0"
 
 
-@pytest.mark.asyncio
 async def test_update_values_404_triggers_relogin(
     client: OumanEh800Client, m: aioresponses
 ):
     # First request returns 404
     m.get(
-        re.compile(r".*/update\?S_92_85.*50.*"),
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
         status=404,
     )
     # Then login
@@ -290,7 +572,7 @@ async def test_update_values_404_triggers_relogin(
     )
     # Then retry update succeeds
     m.get(
-        re.compile(r".*/update\?S_92_85.*50.*"),
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
         body="update?S_92_85=50.0;\x00",
         status=200,
     )
@@ -300,12 +582,85 @@ async def test_update_values_404_triggers_relogin(
     assert response.values["S_92_85"] == "50.0"
 
 
-@pytest.mark.asyncio
+async def test_update_values_concurrent_404s_log_in_once(
+    client: OumanEh800Client, m: aioresponses
+):
+    logins = 0
+
+    async def login_callback(url, **kwargs):
+        nonlocal logins
+        # Give the other update time to hit its 404 while logging in.
+        await asyncio.sleep(0.01)
+        logins += 1
+        return CallbackResult(body="login?result=ok;\x00")
+
+    def update_callback(url, **kwargs):
+        if not logins:
+            return CallbackResult(status=404, reason="Not Found")
+        return CallbackResult(body="update?S_92_85=50.0;\x00")
+
+    m.get(MOCK_LOGIN_URL, callback=login_callback, repeat=True)
+    m.get(
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
+        callback=update_callback,
+        repeat=True,
+    )
+
+    await asyncio.gather(
+        client._update_values({"S_92_85": "50"}),
+        client._update_values({"S_92_85": "50"}),
+    )
+
+    assert logins == 1
+
+
+async def test_update_values_late_404_after_login_does_not_log_in_again(
+    client: OumanEh800Client, m: aioresponses
+):
+    logins = 0
+    updates = 0
+    both_sent = asyncio.Event()
+    logged_in = asyncio.Event()
+
+    async def login_callback(url, **kwargs):
+        nonlocal logins
+        await both_sent.wait()
+        logins += 1
+        logged_in.set()
+        return CallbackResult(body="login?result=ok;\x00")
+
+    async def update_callback(url, **kwargs):
+        nonlocal updates
+        updates += 1
+        if updates == 1:
+            return CallbackResult(status=404, reason="Not Found")
+        if updates == 2:
+            # Sent before the login, but the 404 only arrives after it.
+            both_sent.set()
+            await logged_in.wait()
+            return CallbackResult(status=404, reason="Not Found")
+        return CallbackResult(body="update?S_92_85=50.0;\x00")
+
+    m.get(MOCK_LOGIN_URL, callback=login_callback, repeat=True)
+    m.get(
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
+        callback=update_callback,
+        repeat=True,
+    )
+
+    await asyncio.gather(
+        client._update_values({"S_92_85": "50"}),
+        client._update_values({"S_92_85": "50"}),
+    )
+
+    assert logins == 1
+
+
 async def test_update_values_non_404_error_raises(
     client: OumanEh800Client, m: aioresponses
 ):
     m.get(
-        re.compile(r".*/update\?S_92_85.*50.*"),
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
         status=500,
     )
 
@@ -314,301 +669,309 @@ async def test_update_values_non_404_error_raises(
 
 
 # =============================================================================
-# Tests for _set_int_endpoint
+# Tests for set_endpoint_value with int endpoints
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_set_int_endpoint_success(client: OumanEh800Client, m: aioresponses):
     endpoint = L1BaseEndpoints.VALVE_POSITION_SETPOINT
     m.get(
-        re.compile(r".*/update\?S_92_85.*50.*"),
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
         body=f"update?{endpoint.sensor_endpoint_id}=50.0;\x00",
         status=200,
     )
 
-    result = await client._set_int_endpoint(endpoint, 50)
+    result = await client.set_endpoint_value(endpoint, 50)
 
     assert result == 50
 
 
-@pytest.mark.asyncio
 async def test_set_int_endpoint_value_below_min_raises(client: OumanEh800Client):
     endpoint = L1BaseEndpoints.VALVE_POSITION_SETPOINT  # min_val=0, max_val=100
 
-    with pytest.raises(ValueError) as exc_info:
-        await client._set_int_endpoint(endpoint, -1)
+    with pytest.raises(ValueError, match="out of bounds"):
+        await client.set_endpoint_value(endpoint, -1)
 
-    assert "out of bounds" in str(exc_info.value)
 
-
-@pytest.mark.asyncio
 async def test_set_int_endpoint_value_above_max_raises(client: OumanEh800Client):
     endpoint = L1BaseEndpoints.VALVE_POSITION_SETPOINT  # min_val=0, max_val=100
 
-    with pytest.raises(ValueError) as exc_info:
-        await client._set_int_endpoint(endpoint, 101)
-
-    assert "out of bounds" in str(exc_info.value)
+    with pytest.raises(ValueError, match="out of bounds"):
+        await client.set_endpoint_value(endpoint, 101)
 
 
-@pytest.mark.asyncio
 async def test_set_int_endpoint_missing_response_raises(
     client: OumanEh800Client, m: aioresponses
 ):
     endpoint = L1BaseEndpoints.VALVE_POSITION_SETPOINT
     m.get(
-        re.compile(r".*/update\?S_92_85.*50.*"),
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
         body="update?some_other_id=50.0;\x00",
         status=200,
     )
 
-    with pytest.raises(OumanClientError) as exc_info:
-        await client._set_int_endpoint(endpoint, 50)
-
-    assert "Endpoint ID missing" in str(exc_info.value)
+    with pytest.raises(OumanClientError, match="Endpoint ID missing"):
+        await client.set_endpoint_value(endpoint, 50)
 
 
-@pytest.mark.asyncio
 async def test_set_int_endpoint_mismatched_value_raises(
     client: OumanEh800Client, m: aioresponses
 ):
     endpoint = L1BaseEndpoints.VALVE_POSITION_SETPOINT
     m.get(
-        re.compile(r".*/update\?S_92_85.*50.*"),
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253B{MOCK_DATE_PARAM}",
         body=f"update?{endpoint.sensor_endpoint_id}=99.0;\x00",  # Returns different value
         status=200,
     )
 
-    with pytest.raises(OumanClientError) as exc_info:
-        await client._set_int_endpoint(endpoint, 50)
-
-    assert "does not match" in str(exc_info.value)
+    with pytest.raises(OumanClientError, match="does not match"):
+        await client.set_endpoint_value(endpoint, 50)
 
 
 # =============================================================================
-# Tests for _set_float_endpoint
+# Tests for set_endpoint_value with float endpoints
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_set_float_endpoint_success(client: OumanEh800Client, m: aioresponses):
     endpoint = L1NoRoomSensor.ROOM_TEMPERATURE_FINE_TUNING
     m.get(
-        re.compile(r".*/update\?.*S_134_85.*1\.5.*"),
+        f"{MOCK_ADDRESS}/update?%2540_S_134_85=1.5%253B{MOCK_DATE_PARAM}",
         body=f"update?{endpoint.sensor_endpoint_id}=1.5;\x00",
         status=200,
     )
 
-    result = await client._set_float_endpoint(endpoint, 1.5)
+    result = await client.set_endpoint_value(endpoint, 1.5)
 
     assert result == 1.5
 
 
-@pytest.mark.asyncio
 async def test_set_float_endpoint_rounds_to_one_decimal(
     client: OumanEh800Client, m: aioresponses
 ):
     endpoint = L1NoRoomSensor.ROOM_TEMPERATURE_FINE_TUNING
     # Value 1.55 should be rounded to 1.6
     m.get(
-        re.compile(r".*/update\?.*S_134_85.*1\.6.*"),
+        f"{MOCK_ADDRESS}/update?%2540_S_134_85=1.6%253B{MOCK_DATE_PARAM}",
         body=f"update?{endpoint.sensor_endpoint_id}=1.6;\x00",
         status=200,
     )
 
-    result = await client._set_float_endpoint(endpoint, 1.55)
+    result = await client.set_endpoint_value(endpoint, 1.55)
 
     assert result == 1.6
 
 
-@pytest.mark.asyncio
 async def test_set_float_endpoint_value_below_min_raises(client: OumanEh800Client):
     endpoint = L1NoRoomSensor.ROOM_TEMPERATURE_FINE_TUNING  # min_val=-4.0, max_val=4.0
 
-    with pytest.raises(ValueError) as exc_info:
-        await client._set_float_endpoint(endpoint, -5.0)
-
-    assert "out of bounds" in str(exc_info.value)
+    with pytest.raises(ValueError, match="out of bounds"):
+        await client.set_endpoint_value(endpoint, -5.0)
 
 
-@pytest.mark.asyncio
 async def test_set_float_endpoint_value_above_max_raises(client: OumanEh800Client):
     endpoint = L1NoRoomSensor.ROOM_TEMPERATURE_FINE_TUNING  # min_val=-4.0, max_val=4.0
 
-    with pytest.raises(ValueError) as exc_info:
-        await client._set_float_endpoint(endpoint, 5.0)
+    with pytest.raises(ValueError, match="out of bounds"):
+        await client.set_endpoint_value(endpoint, 5.0)
 
-    assert "out of bounds" in str(exc_info.value)
 
-
-@pytest.mark.asyncio
 async def test_set_float_endpoint_mismatched_value_raises(
     client: OumanEh800Client, m: aioresponses
 ):
     endpoint = L1NoRoomSensor.ROOM_TEMPERATURE_FINE_TUNING
     m.get(
-        re.compile(r".*/update\?.*S_134_85.*1\.5.*"),
+        f"{MOCK_ADDRESS}/update?%2540_S_134_85=1.5%253B{MOCK_DATE_PARAM}",
         body=f"update?{endpoint.sensor_endpoint_id}=2.5;\x00",  # Returns different value
         status=200,
     )
 
-    with pytest.raises(OumanClientError) as exc_info:
-        await client._set_float_endpoint(endpoint, 1.5)
-
-    assert "does not match" in str(exc_info.value)
+    with pytest.raises(OumanClientError, match="does not match"):
+        await client.set_endpoint_value(endpoint, 1.5)
 
 
 # =============================================================================
-# Tests for _set_enum_endpoint
+# Tests for set_endpoint_value with enum endpoints
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_set_enum_endpoint_success(client: OumanEh800Client, m: aioresponses):
     endpoint = L1BaseEndpoints.OPERATION_MODE
     m.get(
-        re.compile(r".*/update\?S_59_85.*0.*"),
+        f"{MOCK_ADDRESS}/update?S_59_85=0%253B{MOCK_DATE_PARAM}",
         body="update?S_59_85=0;\x00",
         status=200,
     )
 
-    result = await client._set_enum_endpoint(endpoint, OperationMode.AUTOMATIC)
+    result = await client.set_endpoint_value(endpoint, OperationMode.AUTOMATIC)
 
     assert result == OperationMode.AUTOMATIC
 
 
-@pytest.mark.asyncio
 async def test_set_enum_endpoint_wrong_type_raises(client: OumanEh800Client):
     endpoint = L1BaseEndpoints.OPERATION_MODE  # expects OperationMode
 
-    with pytest.raises(TypeError) as exc_info:
-        await client._set_enum_endpoint(endpoint, HomeAwayControl.HOME)  # Wrong type
+    with pytest.raises(TypeError, match="Unexpected type"):
+        await client.set_endpoint_value(endpoint, HomeAwayControl.HOME)  # Wrong type
 
-    assert "Unexpected type" in str(exc_info.value)
 
-
-@pytest.mark.asyncio
 async def test_set_enum_endpoint_missing_response_raises(
     client: OumanEh800Client, m: aioresponses
 ):
     endpoint = L1BaseEndpoints.OPERATION_MODE
     m.get(
-        re.compile(r".*/update\?S_59_85.*0.*"),
+        f"{MOCK_ADDRESS}/update?S_59_85=0%253B{MOCK_DATE_PARAM}",
         body="update?some_other_id=0;\x00",
         status=200,
     )
 
-    with pytest.raises(OumanClientError) as exc_info:
-        await client._set_enum_endpoint(endpoint, OperationMode.AUTOMATIC)
-
-    assert "Endpoint ID missing" in str(exc_info.value)
+    with pytest.raises(OumanClientError, match="Endpoint ID missing"):
+        await client.set_endpoint_value(endpoint, OperationMode.AUTOMATIC)
 
 
-@pytest.mark.asyncio
 async def test_set_enum_endpoint_mismatched_value_raises(
     client: OumanEh800Client, m: aioresponses
 ):
     endpoint = L1BaseEndpoints.OPERATION_MODE
     m.get(
-        re.compile(r".*/update\?S_59_85.*0.*"),
+        f"{MOCK_ADDRESS}/update?S_59_85=0%253B{MOCK_DATE_PARAM}",
         body="update?S_59_85=1;\x00",  # Returns TEMPERATURE_DROP instead of AUTOMATIC
         status=200,
     )
 
-    with pytest.raises(OumanClientError) as exc_info:
-        await client._set_enum_endpoint(endpoint, OperationMode.AUTOMATIC)
-
-    assert "does not match" in str(exc_info.value)
+    with pytest.raises(OumanClientError, match="does not match"):
+        await client.set_endpoint_value(endpoint, OperationMode.AUTOMATIC)
 
 
-# =============================================================================
-# Tests for set_endpoint_value (type dispatcher)
-# =============================================================================
-
-
-@pytest.mark.asyncio
-async def test_set_endpoint_value_int(client: OumanEh800Client, m: aioresponses):
-    endpoint = L1BaseEndpoints.VALVE_POSITION_SETPOINT
-    m.get(
-        re.compile(r".*/update\?S_92_85.*50.*"),
-        body=f"update?{endpoint.sensor_endpoint_id}=50.0;\x00",
-        status=200,
+async def test_set_enum_endpoint_checks_every_response_id(
+    client: OumanEh800Client, m: aioresponses
+):
+    endpoint = EnumControlOumanEndpoint(
+        name="test_two_response_ids",
+        unit=None,
+        sensor_endpoint_id="S_59_85",
+        control_endpoint_ids=("S_59_85",),
+        response_endpoint_ids=("S_59_85", "S_146_85"),
+        enum_type=OperationMode,
     )
-
-    result = await client.set_endpoint_value(endpoint, 50)
-
-    assert result == 50
-
-
-@pytest.mark.asyncio
-async def test_set_endpoint_value_float(client: OumanEh800Client, m: aioresponses):
-    endpoint = L1NoRoomSensor.ROOM_TEMPERATURE_FINE_TUNING
     m.get(
-        re.compile(r".*/update\?.*S_134_85.*1\.5.*"),
-        body=f"update?{endpoint.sensor_endpoint_id}=1.5;\x00",
+        f"{MOCK_ADDRESS}/update?S_59_85=0%253B{MOCK_DATE_PARAM}",
+        body="update?S_59_85=1;S_146_85=0;\x00",  # Only the last one matches
         status=200,
     )
 
-    result = await client.set_endpoint_value(endpoint, 1.5)
-
-    assert result == 1.5
+    with pytest.raises(OumanClientError, match="does not match"):
+        await client.set_endpoint_value(endpoint, OperationMode.AUTOMATIC)
 
 
-@pytest.mark.asyncio
-async def test_set_endpoint_value_enum(client: OumanEh800Client, m: aioresponses):
-    endpoint = L1BaseEndpoints.OPERATION_MODE
-    m.get(
-        re.compile(r".*/update\?S_59_85.*0.*"),
-        body="update?S_59_85=0;\x00",
-        status=200,
-    )
-
-    result = await client.set_endpoint_value(endpoint, OperationMode.AUTOMATIC)
-
-    assert result == OperationMode.AUTOMATIC
+# =============================================================================
+# Tests for set_endpoint_value (type dispatcher)
+# =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_set_endpoint_value_non_controllable_raises(client: OumanEh800Client):
     endpoint = SystemEndpoints.OUTSIDE_TEMPERATURE  # Not controllable
 
-    with pytest.raises(TypeError) as exc_info:
+    with pytest.raises(TypeError, match="not a controllable endpoint"):
         await client.set_endpoint_value(endpoint, 20.0)  # type: ignore[arg-type]
 
-    assert "not a controllable endpoint" in str(exc_info.value)
-
 
-@pytest.mark.asyncio
 async def test_set_endpoint_value_int_with_float_value_raises(
     client: OumanEh800Client,
 ):
     endpoint = L1BaseEndpoints.VALVE_POSITION_SETPOINT  # IntControlOumanEndpoint
 
-    with pytest.raises(ValueError) as exc_info:
+    with pytest.raises(ValueError, match="must be an integer"):
         await client.set_endpoint_value(endpoint, 50.5)  # Non-integer float
 
-    assert "must be an integer" in str(exc_info.value)
 
-
-@pytest.mark.asyncio
 async def test_set_endpoint_value_int_with_wrong_type_raises(client: OumanEh800Client):
     endpoint = L1BaseEndpoints.VALVE_POSITION_SETPOINT
 
-    with pytest.raises(TypeError) as exc_info:
+    with pytest.raises(TypeError, match="must be numeric"):
         await client.set_endpoint_value(endpoint, "50")  # String instead of int
 
-    assert "must be numeric" in str(exc_info.value)
-
 
-@pytest.mark.asyncio
 async def test_set_endpoint_value_enum_with_wrong_type_raises(client: OumanEh800Client):
     endpoint = L1BaseEndpoints.OPERATION_MODE
 
-    with pytest.raises(TypeError) as exc_info:
+    with pytest.raises(TypeError, match="must be a ControlEnum"):
         await client.set_endpoint_value(endpoint, 0)  # int instead of ControlEnum
 
-    assert "must be a ControlEnum" in str(exc_info.value)
+
+# =============================================================================
+# Tests for set_endpoint_values (batched update)
+# =============================================================================
+
+
+async def test_set_endpoint_values_single_request(
+    client: OumanEh800Client, m: aioresponses
+):
+    m.get(
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253BS_59_85%253D0%253B{MOCK_DATE_PARAM}",
+        body="update?S_92_85=50.0;S_59_85=0;\x00",
+        status=200,
+    )
+
+    result = await client.set_endpoint_values(
+        {
+            L1BaseEndpoints.VALVE_POSITION_SETPOINT: 50,
+            L1BaseEndpoints.OPERATION_MODE: OperationMode.AUTOMATIC,
+        }
+    )
+
+    assert result == {
+        L1BaseEndpoints.VALVE_POSITION_SETPOINT: 50,
+        L1BaseEndpoints.OPERATION_MODE: OperationMode.AUTOMATIC,
+    }
+    assert len(m.requests) == 1
+
+
+async def test_set_endpoint_values_mismatched_value_raises(
+    client: OumanEh800Client, m: aioresponses
+):
+    m.get(
+        f"{MOCK_ADDRESS}/update?S_92_85=50%253BS_59_85%253D0%253B{MOCK_DATE_PARAM}",
+        body="update?S_92_85=50.0;S_59_85=1;\x00",
+        status=200,
+    )
+
+    with pytest.raises(OumanClientError, match="does not match"):
+        await client.set_endpoint_values(
+            {
+                L1BaseEndpoints.VALVE_POSITION_SETPOINT: 50,
+                L1BaseEndpoints.OPERATION_MODE: OperationMode.AUTOMATIC,
+            }
+        )
+
+
+async def test_set_endpoint_values_invalid_value_sends_nothing(
+    client: OumanEh800Client, m: aioresponses
+):
+    with pytest.raises(ValueError, match="out of bounds"):
+        await client.set_endpoint_values(
+            {
+                L1BaseEndpoints.OPERATION_MODE: OperationMode.AUTOMATIC,
+                L1BaseEndpoints.VALVE_POSITION_SETPOINT: 101,
+            }
+        )
+    assert not m.requests
+
+
+async def test_set_endpoint_values_conflicting_control_ids_raises(
+    client: OumanEh800Client,
+):
+    with pytest.raises(ValueError, match="Multiple values"):
+        await client.set_endpoint_values(
+            {
+                L1BaseEndpoints.VALVE_POSITION_SETPOINT: 50,
+                _CONFLICTING_VALVE_ENDPOINT: 60,
+            }
+        )
+
+
+async def test_set_endpoint_values_empty(client: OumanEh800Client):
+    assert await client.set_endpoint_values({}) == {}
 
 
 # =============================================================================
@@ -616,19 +979,14 @@ async def test_set_endpoint_value_enum_with_wrong_type_raises(client: OumanEh800
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_get_values_single_registry(client: OumanEh800Client, m: aioresponses):
-    # Build the endpoint IDs that will be requested
-    registry_set = OumanRegistrySet([SystemEndpoints])
-    params = "%253B".join(registry_set.sensor_endpoint_ids)
-
     m.get(
-        f"{MOCK_ADDRESS}/request?{params}%253B{MOCK_DATE_PARAM}",
+        _SYSTEM_REQUEST_URL,
         body="request?S_26_85=600;S_135_85=0;S_227_85=-13.3;S_1002_85=test;S_1004_85=ok;S_140_85=0;\x00",
         status=200,
     )
 
-    result = await client.get_values(registry_set)
+    result = await client.get_values(_SYSTEM_REGISTRY_SET)
 
     assert SystemEndpoints.OUTSIDE_TEMPERATURE in result
     assert result[SystemEndpoints.OUTSIDE_TEMPERATURE] == -13.3
@@ -636,24 +994,34 @@ async def test_get_values_single_registry(client: OumanEh800Client, m: aiorespon
     assert result[SystemEndpoints.HOME_AWAY_MODE] == HomeAwayControl.HOME
 
 
-@pytest.mark.asyncio
 async def test_get_values_unknown_endpoint_logs_warning(
     client: OumanEh800Client, m: aioresponses, caplog
 ):
-    registry_set = OumanRegistrySet([SystemEndpoints])
-    params = "%253B".join(registry_set.sensor_endpoint_ids)
-
+    caplog.set_level(logging.WARNING, logger="ouman_eh_800_api")
     # Response includes an unknown endpoint
     m.get(
-        f"{MOCK_ADDRESS}/request?{params}%253B{MOCK_DATE_PARAM}",
+        _SYSTEM_REQUEST_URL,
         body="request?S_26_85=600;S_135_85=0;S_227_85=-13.3;S_1002_85=test;S_1004_85=ok;S_140_85=0;UNKNOWN_ID=123;\x00",
         status=200,
     )
 
-    await client.get_values(registry_set)
+    await client.get_values(_SYSTEM_REGISTRY_SET)
 
-    assert "Unexpected endpoint ID" in caplog.text
-    assert "UNKNOWN_ID" in caplog.text
+    assert [r.getMessage() for r in caplog.records] == [
+        "Unexpected endpoint ID in response: 'UNKNOWN_ID'"
+    ]
+
+
+async def test_get_values_empty_registry_set(client: OumanEh800Client, m: aioresponses):
+    m.get(
+        f"{MOCK_ADDRESS}/request?{MOCK_DATE_PARAM}",
+        body="request?\x00",
+        status=200,
+    )
+
+    result = await client.get_values(OumanRegistrySet([]))
+
+    assert result == {}
 
 
 # =============================================================================
@@ -661,28 +1029,24 @@ async def test_get_values_unknown_endpoint_logs_warning(
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_get_is_l2_installed_true(client: OumanEh800Client, m: aioresponses):
-    endpoint_id = SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id
+def _mock_request(m: aioresponses, sensor_id: str, value: str) -> None:
     m.get(
-        f"{MOCK_ADDRESS}/request?{endpoint_id}%253B{MOCK_DATE_PARAM}",
-        body=f"request?{endpoint_id}=1;\x00",  # Non-zero means installed
+        f"{MOCK_ADDRESS}/request?{sensor_id}%253B{MOCK_DATE_PARAM}",
+        body=f"request?{sensor_id}={value};\x00",
         status=200,
     )
 
+
+async def test_get_is_l2_installed_true(client: OumanEh800Client, m: aioresponses):
+    _mock_request(m, _L2_INSTALLED_ID, "1")  # Non-zero means installed
+
     result = await client.get_is_l2_installed()
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_get_is_l2_installed_false(client: OumanEh800Client, m: aioresponses):
-    endpoint_id = SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id
-    m.get(
-        f"{MOCK_ADDRESS}/request?{endpoint_id}%253B{MOCK_DATE_PARAM}",
-        body=f"request?{endpoint_id}=0;\x00",
-        status=200,
-    )
+    _mock_request(m, _L2_INSTALLED_ID, "0")
 
     result = await client.get_is_l2_installed()
 
@@ -694,96 +1058,60 @@ async def test_get_is_l2_installed_false(client: OumanEh800Client, m: aiorespons
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_get_is_room_sensor_installed_true(
     client: OumanEh800Client, m: aioresponses
 ):
-    endpoint_id = L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
-    m.get(
-        f"{MOCK_ADDRESS}/request?{endpoint_id}%253B{MOCK_DATE_PARAM}",
-        body=f"request?{endpoint_id}=on;\x00",  # Non-"off" means installed
-        status=200,
-    )
+    _mock_request(m, _L1_ROOM_SENSOR_INSTALLED_ID, "on")  # Non-"off" means installed
 
-    result = await client._get_is_room_sensor_installed(endpoint_id)
+    result = await client._get_is_room_sensor_installed(_L1_ROOM_SENSOR_INSTALLED_ID)
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_get_is_room_sensor_installed_false(
     client: OumanEh800Client, m: aioresponses
 ):
-    endpoint_id = L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
-    m.get(
-        f"{MOCK_ADDRESS}/request?{endpoint_id}%253B{MOCK_DATE_PARAM}",
-        body=f"request?{endpoint_id}=off;\x00",
-        status=200,
-    )
+    _mock_request(m, _L1_ROOM_SENSOR_INSTALLED_ID, "off")
 
-    result = await client._get_is_room_sensor_installed(endpoint_id)
+    result = await client._get_is_room_sensor_installed(_L1_ROOM_SENSOR_INSTALLED_ID)
 
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_get_is_room_sensor_installed_on_with_error(
     client: OumanEh800Client, m: aioresponses
 ):
-    endpoint_id = L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
-    m.get(
-        f"{MOCK_ADDRESS}/request?{endpoint_id}%253B{MOCK_DATE_PARAM}",
-        body=f"request?{endpoint_id}=on,error;\x00",
-        status=200,
-    )
+    _mock_request(m, _L1_ROOM_SENSOR_INSTALLED_ID, "on,error")
 
-    result = await client._get_is_room_sensor_installed(endpoint_id)
+    result = await client._get_is_room_sensor_installed(_L1_ROOM_SENSOR_INSTALLED_ID)
 
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_get_is_room_sensor_installed_off_with_error(
     client: OumanEh800Client, m: aioresponses
 ):
-    endpoint_id = L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
-    m.get(
-        f"{MOCK_ADDRESS}/request?{endpoint_id}%253B{MOCK_DATE_PARAM}",
-        body=f"request?{endpoint_id}=off,error;\x00",
-        status=200,
-    )
+    _mock_request(m, _L1_ROOM_SENSOR_INSTALLED_ID, "off,error")
 
-    result = await client._get_is_room_sensor_installed(endpoint_id)
+    result = await client._get_is_room_sensor_installed(_L1_ROOM_SENSOR_INSTALLED_ID)
 
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_get_is_l1_room_sensor_installed(
     client: OumanEh800Client, m: aioresponses
 ):
-    endpoint_id = L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
-    m.get(
-        f"{MOCK_ADDRESS}/request?{endpoint_id}%253B{MOCK_DATE_PARAM}",
-        body=f"request?{endpoint_id}=off;\x00",
-        status=200,
-    )
+    _mock_request(m, _L1_ROOM_SENSOR_INSTALLED_ID, "off")
 
     result = await client.get_is_l1_room_sensor_installed()
 
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_get_is_l2_room_sensor_installed(
     client: OumanEh800Client, m: aioresponses
 ):
-    endpoint_id = L2BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id
-    m.get(
-        f"{MOCK_ADDRESS}/request?{endpoint_id}%253B{MOCK_DATE_PARAM}",
-        body=f"request?{endpoint_id}=off;\x00",
-        status=200,
-    )
+    _mock_request(m, _L2_ROOM_SENSOR_INSTALLED_ID, "off")
 
     result = await client.get_is_l2_room_sensor_installed()
 
@@ -795,7 +1123,6 @@ async def test_get_is_l2_room_sensor_installed(
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_is_l1_five_point_curve_true(client: OumanEh800Client, m: aioresponses):
     five_point_id = L1FivePointCurve.CURVE_MINUS_20_TEMP.sensor_endpoint_id
     m.get(
@@ -807,7 +1134,6 @@ async def test_is_l1_five_point_curve_true(client: OumanEh800Client, m: aiorespo
     assert await client._is_l1_five_point_curve() is True
 
 
-@pytest.mark.asyncio
 async def test_is_l1_five_point_curve_false(client: OumanEh800Client, m: aioresponses):
     m.get(
         f"{MOCK_ADDRESS}/settingsl1?{MOCK_DATE_PARAM}",
@@ -818,7 +1144,6 @@ async def test_is_l1_five_point_curve_false(client: OumanEh800Client, m: aioresp
     assert await client._is_l1_five_point_curve() is False
 
 
-@pytest.mark.asyncio
 async def test_is_l2_five_point_curve_true(client: OumanEh800Client, m: aioresponses):
     five_point_id = L2FivePointCurve.CURVE_MINUS_20_TEMP.sensor_endpoint_id
     m.get(
@@ -830,7 +1155,6 @@ async def test_is_l2_five_point_curve_true(client: OumanEh800Client, m: aiorespo
     assert await client._is_l2_five_point_curve() is True
 
 
-@pytest.mark.asyncio
 async def test_is_l2_five_point_curve_false(client: OumanEh800Client, m: aioresponses):
     m.get(
         f"{MOCK_ADDRESS}/settingsl2?{MOCK_DATE_PARAM}",
@@ -867,7 +1191,6 @@ async def test_is_l2_five_point_curve_false(client: OumanEh800Client, m: aioresp
         "general_alarm",
     ],
 )
-@pytest.mark.asyncio
 async def test_get_relay_fragment(
     client: OumanEh800Client, m: aioresponses, body: str, expected
 ):
@@ -885,18 +1208,36 @@ async def test_get_relay_fragment(
 # =============================================================================
 
 
-def _mock_request(m: aioresponses, sensor_id: str, value: str) -> None:
+def _mock_settings(m: aioresponses, name: str, body: str) -> None:
     m.get(
-        f"{MOCK_ADDRESS}/request?{sensor_id}%253B{MOCK_DATE_PARAM}",
-        body=f"request?{sensor_id}={value};\x00",
+        f"{MOCK_ADDRESS}/{name}?{MOCK_DATE_PARAM}",
+        body=f"{name}?{body}\x00",
         status=200,
     )
 
 
-def _mock_settings(m: aioresponses, name: str, body: str) -> None:
+def _mock_probes(
+    m: aioresponses,
+    l1_room_sensor: str,
+    l2_installed: str,
+    l2_room_sensor: str | None = "off",
+) -> None:
+    """Mock the discovery probe. A None value is left out of the response."""
+    ids = (
+        _L1_ROOM_SENSOR_INSTALLED_ID,
+        _L2_INSTALLED_ID,
+        _L2_ROOM_SENSOR_INSTALLED_ID,
+    )
+    values = (l1_room_sensor, l2_installed, l2_room_sensor)
     m.get(
-        f"{MOCK_ADDRESS}/{name}?{MOCK_DATE_PARAM}",
-        body=f"{name}?{body}\x00",
+        f"{MOCK_ADDRESS}/request?{'%253B'.join(ids)}%253B{MOCK_DATE_PARAM}",
+        body="request?"
+        + "".join(
+            f"{id}={value};"
+            for id, value in zip(ids, values, strict=True)
+            if value is not None
+        )
+        + "\x00",
         status=200,
     )
 
@@ -908,14 +1249,12 @@ _FIVE_POINT_L2_BODY = "-20,S_154_85;-10,S_156_85;0,S_158_85;10,S_160_85;20,S_162
 _RELAY_NOT_IN_USE_BODY = "Rele ei käytössä,S_0_85;"
 
 
-@pytest.mark.asyncio
 async def test_get_active_registries_l1_only_no_room_sensor_three_point(
     client: OumanEh800Client, m: aioresponses
 ):
     _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
     _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
-    _mock_request(m, L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id, "off")
-    _mock_request(m, SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id, "0")
+    _mock_probes(m, l1_room_sensor="off", l2_installed="0")
 
     result = await client.get_active_registries()
 
@@ -927,14 +1266,12 @@ async def test_get_active_registries_l1_only_no_room_sensor_three_point(
     }
 
 
-@pytest.mark.asyncio
 async def test_get_active_registries_l1_with_room_sensor_five_point(
     client: OumanEh800Client, m: aioresponses
 ):
     _mock_settings(m, "settingsl1", _FIVE_POINT_L1_BODY)
     _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
-    _mock_request(m, L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id, "on")
-    _mock_request(m, SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id, "0")
+    _mock_probes(m, l1_room_sensor="on", l2_installed="0")
 
     result = await client.get_active_registries()
 
@@ -946,16 +1283,31 @@ async def test_get_active_registries_l1_with_room_sensor_five_point(
     }
 
 
-@pytest.mark.asyncio
+async def test_get_active_registries_missing_l2_room_sensor_value(
+    client: OumanEh800Client, m: aioresponses, caplog
+):
+    caplog.set_level(logging.WARNING, logger="ouman_eh_800_api")
+    _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
+    _mock_settings(m, "settingsl2", _THREE_POINT_L2_BODY)
+    _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
+    _mock_probes(m, l1_room_sensor="off", l2_installed="1", l2_room_sensor=None)
+
+    result = await client.get_active_registries()
+
+    assert L2NoRoomSensor in result.registries
+    assert L2RoomSensor not in result.registries
+    assert [r.getMessage() for r in caplog.records] == [
+        f"Requested endpoint ID '{_L2_ROOM_SENSOR_INSTALLED_ID}' not found in response"
+    ]
+
+
 async def test_get_active_registries_l1_and_l2_no_room_sensors(
     client: OumanEh800Client, m: aioresponses
 ):
     _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
     _mock_settings(m, "settingsl2", _THREE_POINT_L2_BODY)
     _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
-    _mock_request(m, L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id, "off")
-    _mock_request(m, SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id, "1")
-    _mock_request(m, L2BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id, "off")
+    _mock_probes(m, l1_room_sensor="off", l2_installed="1", l2_room_sensor="off")
 
     result = await client.get_active_registries()
 
@@ -970,16 +1322,13 @@ async def test_get_active_registries_l1_and_l2_no_room_sensors(
     }
 
 
-@pytest.mark.asyncio
 async def test_get_active_registries_all_with_room_sensors(
     client: OumanEh800Client, m: aioresponses
 ):
     _mock_settings(m, "settingsl1", _FIVE_POINT_L1_BODY)
     _mock_settings(m, "settingsl2", _FIVE_POINT_L2_BODY)
     _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
-    _mock_request(m, L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id, "on")
-    _mock_request(m, SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id, "1")
-    _mock_request(m, L2BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id, "on")
+    _mock_probes(m, l1_room_sensor="on", l2_installed="1", l2_room_sensor="on")
 
     result = await client.get_active_registries()
 
@@ -994,26 +1343,132 @@ async def test_get_active_registries_all_with_room_sensors(
     }
 
 
-@pytest.mark.asyncio
 async def test_get_active_registries_with_relay_temperature_mode(
     client: OumanEh800Client, m: aioresponses
 ):
     _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
     _mock_settings(m, "relay", "Automaatti,S_330_85;ON,S_330_85;OFF,S_330_85;")
-    _mock_request(m, L1BaseEndpoints.ROOM_SENSOR_INSTALLED.sensor_endpoint_id, "off")
-    _mock_request(m, SystemEndpoints.L2_INSTALLED_STATUS.sensor_endpoint_id, "0")
+    _mock_probes(m, l1_room_sensor="off", l2_installed="0")
 
     result = await client.get_active_registries()
 
     assert RelayTemperature in result.registries
 
 
+async def test_get_active_registries_reuses_registry_set(
+    client: OumanEh800Client, m: aioresponses
+):
+    for _ in range(2):
+        _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
+        _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
+        _mock_probes(m, l1_room_sensor="off", l2_installed="0")
+
+    first = await client.get_active_registries()
+    second = await client.get_active_registries()
+
+    assert second is first
+
+
+async def test_get_active_registries_cached_within_ttl(
+    session: ClientSession, m: aioresponses, monkeypatch
+):
+    client = OumanEh800Client(
+        session=session,
+        address=MOCK_ADDRESS,
+        username=MOCK_USERNAME,
+        password=MOCK_PASSWORD,
+        registry_cache_ttl=900,
+    )
+    _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
+    _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
+    _mock_probes(m, l1_room_sensor="off", l2_installed="0")
+    monkeypatch.setattr("ouman_eh_800_api.client.monotonic", lambda: 100.0)
+
+    first = await client.get_active_registries()
+    second = await client.get_active_registries()
+
+    assert second is first
+    assert len(m.requests) == 3
+
+
+async def test_invalidate_registry_cache_probes_again(
+    session: ClientSession, m: aioresponses
+):
+    client = OumanEh800Client(
+        session=session,
+        address=MOCK_ADDRESS,
+        username=MOCK_USERNAME,
+        password=MOCK_PASSWORD,
+        registry_cache_ttl=900,
+    )
+    _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
+    _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
+    _mock_probes(m, l1_room_sensor="off", l2_installed="0")
+    _mock_settings(m, "settingsl1", _FIVE_POINT_L1_BODY)
+    _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
+    _mock_probes(m, l1_room_sensor="off", l2_installed="0")
+
+    await client.get_active_registries()
+    client.invalidate_registry_cache()
+    result = await client.get_active_registries()
+
+    assert L1FivePointCurve in result.registries
+
+
+async def test_invalidate_registry_cache_skips_cached_probe(
+    session: ClientSession, m: aioresponses
+):
+    client = OumanEh800Client(
+        session=session,
+        address=MOCK_ADDRESS,
+        username=MOCK_USERNAME,
+        password=MOCK_PASSWORD,
+        cache_ttl=900,
+        registry_cache_ttl=900,
+    )
+    _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
+    _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
+    _mock_probes(m, l1_room_sensor="off", l2_installed="0")
+    _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
+    _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
+    _mock_probes(m, l1_room_sensor="on", l2_installed="0")
+
+    await client.get_active_registries()
+    client.invalidate_registry_cache()
+    result = await client.get_active_registries()
+
+    assert L1RoomSensor in result.registries
+
+
+async def test_get_all_values_reads_active_registries_in_one_request(
+    client: OumanEh800Client, m: aioresponses
+):
+    _mock_settings(m, "settingsl1", _THREE_POINT_L1_BODY)
+    _mock_settings(m, "relay", _RELAY_NOT_IN_USE_BODY)
+    _mock_probes(m, l1_room_sensor="off", l2_installed="0")
+    registry_set = OumanRegistrySet(
+        [SystemEndpoints, L1BaseEndpoints, L1ThreePointCurve, L1NoRoomSensor]
+    )
+    m.get(
+        f"{MOCK_ADDRESS}/request?"
+        f"{'%253B'.join(registry_set.sensor_endpoint_ids)}%253B{MOCK_DATE_PARAM}",
+        body="request?S_227_85=-13.3;S_59_85=0;\x00",
+        status=200,
+    )
+
+    result = await client.get_all_values()
+
+    assert result == {
+        SystemEndpoints.OUTSIDE_TEMPERATURE: -13.3,
+        L1BaseEndpoints.OPERATION_MODE: OperationMode.AUTOMATIC,
+    }
+
+
 # =============================================================================
 # Tests for get_alarms
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_get_alarms_success(client: OumanEh800Client, m: aioresponses):
     m.get(
         f"{MOCK_ADDRESS}/alarms?{MOCK_DATE_PARAM}",
@@ -0,0 +1,55 @@
+import pytest
+
+from ouman_eh_800_api.const import OperationMode
+from ouman_eh_800_api.endpoint import EnumControlOumanEndpoint
+from ouman_eh_800_api.registry import L1BaseEndpoints
+
+# =============================================================================
+# Tests for EnumControlOumanEndpoint.parse_value
+# =============================================================================
+
+
+def test_enum_parse_value_returns_member():
+    """parse_value should return the enum member for a known value."""
+    result = L1BaseEndpoints.OPERATION_MODE.parse_value("3")
+
+    assert result is OperationMode.NORMAL_TEMPERATURE
+
+
+def test_enum_parse_value_unknown_raises():
+    """parse_value should raise ValueError for a value outside the enum."""
+    with pytest.raises(ValueError):
+        L1BaseEndpoints.OPERATION_MODE.parse_value("9")
+
+
+# =============================================================================
+# Tests for EnumControlOumanEndpoint ID validation
+# =============================================================================
+
+
+def test_enum_endpoint_ids_normalized_to_tuples():
+    """Control and response IDs should be stored as tuples."""
+    endpoint = EnumControlOumanEndpoint(
+        name="test_enum",
+        unit=None,
+        sensor_endpoint_id="S_59_85",
+        control_endpoint_ids=["S_59_85"],  # type: ignore[arg-type]
+        response_endpoint_ids=["S_59_85"],  # type: ignore[arg-type]
+        enum_type=OperationMode,
+    )
+
+    assert endpoint.control_endpoint_ids == ("S_59_85",)
+    assert endpoint.response_endpoint_ids == ("S_59_85",)
+
+
+def test_enum_endpoint_string_ids_raise():
+    """A bare string instead of a tuple of IDs should be rejected."""
+    with pytest.raises(TypeError, match="control_endpoint_ids"):
+        EnumControlOumanEndpoint(
+            name="test_enum",
+            unit=None,
+            sensor_endpoint_id="S_59_85",
+            control_endpoint_ids=("S_59_85"),  # type: ignore[arg-type]
+            response_endpoint_ids=("S_59_85",),
+            enum_type=OperationMode,
+        )
@@ -1,3 +1,7 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from ouman_eh_800_api.const import OumanUnit
@@ -72,19 +76,15 @@ def test_registry_set_valid_multiple_registries():
 
 def test_registry_set_duplicate_registry_raises():
     """Passing the same registry multiple times should raise ValueError."""
-    with pytest.raises(ValueError) as exc_info:
+    with pytest.raises(ValueError, match="Multiple of the same registry"):
         OumanRegistrySet([SystemEndpoints, SystemEndpoints])
 
-    assert "Multiple of the same registry" in str(exc_info.value)
-
 
 def test_registry_set_conflicting_endpoint_ids_raises():
     """Passing registries with conflicting sensor_endpoint_ids should raise ValueError."""
-    with pytest.raises(ValueError) as exc_info:
+    with pytest.raises(ValueError, match="Conflicting endpoint IDs"):
         OumanRegistrySet([TestRegistryA, TestRegistryConflicting])
 
-    assert "Conflicting endpoint IDs" in str(exc_info.value)
-
 
 def test_registry_set_empty_registries():
     """Creating a registry set with an empty list should succeed."""
@@ -123,6 +123,53 @@ def test_registry_set_sensor_endpoint_ids_property():
     assert "S_TEST_3" in sensor_ids
 
 
+def test_registry_set_joined_sensor_endpoint_ids():
+    """joined_sensor_endpoint_ids should join the sensor IDs with ';'."""
+    registry_set = OumanRegistrySet([TestRegistryA, TestRegistryB])
+
+    assert registry_set.joined_sensor_endpoint_ids == "S_TEST_1;S_TEST_2;S_TEST_3"
+
+
+def test_registry_set_has_no_instance_dict():
+    """OumanRegistrySet uses slots, so instances carry no __dict__."""
+    registry_set = OumanRegistrySet([TestRegistryA])
+
+    assert not hasattr(registry_set, "__dict__")
+
+
+def test_registry_set_is_immutable():
+    """Registry sets are frozen, so shared instances cannot be modified."""
+    registry_set = OumanRegistrySet([TestRegistryA])
+
+    with pytest.raises(FrozenInstanceError):
+        registry_set.registries = []  # type: ignore[misc]
+
+
+def test_registry_set_equal_regardless_of_sequence_type():
+    """Sets built from a list and from a tuple of registries compare equal."""
+    from_list = OumanRegistrySet([TestRegistryA, TestRegistryB])
+    from_tuple = OumanRegistrySet((TestRegistryA, TestRegistryB))
+
+    assert from_list == from_tuple
+    assert from_list.registries == (TestRegistryA, TestRegistryB)
+
+
+def test_registry_set_survives_deepcopy_and_pickle():
+    """Registry sets can be deep-copied and pickled."""
+    registry_set = OumanRegistrySet([SystemEndpoints, L1BaseEndpoints])
+
+    for copied in (
+        copy.deepcopy(registry_set),
+        pickle.loads(pickle.dumps(registry_set)),
+    ):
+        assert copied == registry_set
+        assert copied.sensor_endpoint_ids == registry_set.sensor_endpoint_ids
+        assert (
+            copied.get_endpoint_by_sensor_id("S_227_85")
+            == SystemEndpoints.OUTSIDE_TEMPERATURE
+        )
+
+
 def test_registry_set_get_endpoint_by_sensor_id():
     """get_endpoint_by_sensor_id should return the correct endpoint."""
     registry_set = OumanRegistrySet([TestRegistryA, TestRegistryB])
@@ -141,6 +188,16 @@ def test_registry_set_get_endpoint_by_sensor_id_not_found():
     assert endpoint is None
 
 
+def test_registry_set_contains_sensor_id():
+    """contains_sensor_id should report IDs from any registry in the set."""
+    registry_set = OumanRegistrySet([TestRegistryA, TestRegistryB])
+
+    assert registry_set.contains_sensor_id("S_TEST_1")
+    assert registry_set.contains_sensor_id("S_TEST_3")
+    assert not registry_set.contains_sensor_id("UNKNOWN_ID")
+    assert not TestRegistryA.contains_sensor_id("S_TEST_3")
+
+
 # =============================================================================
 # Tests for real registry combinations
 # =============================================================================
@@ -163,7 +220,7 @@ def test_registry_set_l1_and_l2_bases():
 
 
 # =============================================================================
-# Tests for OumanRegistry.iterate_endpoints
+# Tests for OumanRegistry.iterate_endpoints and endpoints
 # =============================================================================
 
 
@@ -176,6 +233,24 @@ def test_iterate_endpoints_returns_all_endpoints():
     assert TestRegistryA.ENDPOINT_2 in endpoints
 
 
+def test_endpoints_returns_all_endpoints():
+    """endpoints should return the registry's endpoints as a tuple."""
+    endpoints = TestRegistryA.endpoints()
+
+    assert endpoints == (TestRegistryA.ENDPOINT_1, TestRegistryA.ENDPOINT_2)
+
+
+def test_registry_get_endpoint_by_sensor_id():
+    """get_endpoint_by_sensor_id on a registry should only find its own endpoints."""
+    assert (
+        TestRegistryA.get_endpoint_by_sensor_id("S_TEST_1") == TestRegistryA.ENDPOINT_1
+    )
+    assert TestRegistryA.get_endpoint_by_sensor_id("S_TEST_3") is None
+    assert (
+        TestRegistryB.get_endpoint_by_sensor_id("S_TEST_3") == TestRegistryB.ENDPOINT_3
+    )
+
+
 def test_l1_no_room_sensor_and_room_sensor_share_drop_names():
     """L1NoRoomSensor and L1RoomSensor define endpoints with the same `name`
     but different sensor IDs (TEMPERATURE_DROP, BIG_TEMPERATURE_DROP,
@@ -191,7 +266,7 @@ def test_l1_no_room_sensor_and_room_sensor_share_drop_names():
 
 def test_l1_room_sensor_has_room_specific_endpoints():
     """L1RoomSensor exposes endpoints that have no L1NoRoomSensor counterpart."""
-    names = {e.name for e in L1RoomSensor.iterate_endpoints()}
+    names = {e.name for e in L1RoomSensor.endpoints()}
 
     assert "l1_room_temperature" in names
     assert "l1_room_temperature_setpoint" in names